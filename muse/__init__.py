@@ -16,6 +16,7 @@ __all__ = [
     "instance",
     "memo",
     "proposal",
+    "rpc_async",
     "storage",
     "transactionbuilder",
     "utils",
@@ -1,5 +1,6 @@
 from muse.instance import shared_muse_instance
 from .amount import Amount
+from .cache import TTLCache
 from .exceptions import AccountDoesNotExistsException
 
 
@@ -29,6 +30,8 @@ class Account(dict):
 
     """
 
+    account_cache = TTLCache(maxsize=8192, ttl=30)
+
     def __init__(
         self,
         account,
@@ -52,12 +55,17 @@ class Account(dict):
         """ Refresh/Obtain an account's data from the API server
         """
         import re
-        if re.match("^1\.2\.[0-9]*$", self.name):
-            account = self.muse.rpc.get_objects([self.name])[0]
-        else:
-            account = self.muse.rpc.lookup_account_names([self.name])[0]
+        account = Account.account_cache.get(self.name)
         if not account:
-            raise AccountDoesNotExistsException(self.name)
+            if re.match("^1\.2\.[0-9]*$", self.name):
+                account = self.muse.rpc.get_objects([self.name])[0]
+            else:
+                account = self.muse.rpc.lookup_account_names([self.name])[0]
+            if not account:
+                raise AccountDoesNotExistsException(self.name)
+            # Only cache on a miss; re-caching a hit would reset the
+            # TTL and keep hot entries stale indefinitely
+            self._cache(account)
 
         if self.full:
             account = self.muse.rpc.get_full_accounts([account["id"]], False)[0][1]
@@ -69,6 +77,11 @@ class Account(dict):
             super(Account, self).__init__(account)
         self.name = self["name"]
 
+    def _cache(self, account):
+        # store in cache, keyed by both name and id
+        Account.account_cache[account["name"]] = account
+        Account.account_cache[account["id"]] = account
+
     @property
     def balances(self):
         """ List balances of an account. This call returns instances of
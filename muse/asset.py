@@ -1,5 +1,6 @@
 import json
 from muse.instance import shared_muse_instance
+from .cache import TTLCache
 from .exceptions import AssetDoesNotExistsException
 
 
@@ -18,7 +19,7 @@ class Asset(dict):
                   refreshed with ``Asset.refresh()``.
     """
 
-    assets_cache = dict()
+    assets_cache = TTLCache(maxsize=8192, ttl=30)
 
     def __init__(
         self,
@@ -1,8 +1,39 @@
+import json
+from functools import lru_cache
+
 from muse.instance import shared_muse_instance
 from .exceptions import BlockDoesNotExistsException
+from .storage import cacheStorage
 from .utils import parse_time
 
 
+@lru_cache(maxsize=4096)
+def _cached_get_block(rpc, block_number):
+    """ Blocks are immutable, so repeated instantiations of the same
+        block can be served from a process-wide LRU cache, backed by
+        the on-disk object cache so even separate CLI invocations skip
+        the websocket round-trip
+
+        :raises BlockDoesNotExistsException: if the block does not
+            (yet) exist. Raising keeps the miss out of the LRU, so a
+            retry succeeds once the block is produced.
+    """
+    cached = cacheStorage.get(rpc.url, "block", str(block_number))
+    if cached:
+        return json.loads(cached)
+    batch = rpc.batch()
+    batch.get_block(block_number)
+    batch.get_dynamic_global_properties()
+    block, props = batch.execute()
+    if not block:
+        raise BlockDoesNotExistsException
+    # Only persist blocks that can no longer be reorged out; anything
+    # above the last irreversible block may still change
+    if block_number <= props["last_irreversible_block_num"]:
+        cacheStorage.add(rpc.url, "block", str(block_number), json.dumps(block))
+    return block
+
+
 class Block(dict):
     """ Read a single block from the chain
 
@@ -24,6 +55,9 @@ class Block(dict):
                   refreshed with ``Account.refresh()``.
 
     """
+
+    __slots__ = ("muse", "block")
+
     def __init__(
         self,
         block,
@@ -41,9 +75,7 @@ class Block(dict):
         """ Even though blocks never change, you freshly obtain its contents
             from an API with this method
         """
-        block = self.muse.rpc.get_block(self.block)
-        if not block:
-            raise BlockDoesNotExistsException
+        block = _cached_get_block(self.muse.rpc, self.block)
         super(Block, self).__init__(block)
 
     def time(self):
@@ -0,0 +1,68 @@
+import time
+from collections import OrderedDict
+
+
+class TTLCache(object):
+    """ A small dict-like cache whose entries expire after ``ttl``
+        seconds and that evicts the oldest entry once ``maxsize`` is
+        reached.
+
+        :param int maxsize: Maximum number of entries to keep
+        :param int ttl: Seconds after which an entry expires
+
+        This is used to collapse repeated lookups of the same account,
+        asset or committee member into a single RPC per TTL window.
+    """
+    def __init__(self, maxsize=8192, ttl=30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._store = OrderedDict()
+
+    def __setitem__(self, key, value):
+        if key in self._store:
+            del self._store[key]
+        elif len(self._store) >= self.maxsize:
+            self._store.popitem(last=False)
+        self._store[key] = (time.time() + self.ttl, value)
+
+    def __getitem__(self, key):
+        expires, value = self._store[key]
+        if expires < time.time():
+            del self._store[key]
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def __len__(self):
+        return len(self._store)
+
+    def get(self, key, default=None):
+        """ Return the value for ``key`` if present and not expired,
+            else ``default``
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, default=None):
+        """ Remove ``key`` and return its value (or ``default`` when
+            missing or expired)
+        """
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        del self._store[key]
+        return value
+
+    def clear(self):
+        """ Drop all cached entries
+        """
+        self._store.clear()
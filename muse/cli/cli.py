@@ -1,10 +1,6 @@
 #!/usr/bin/env python3
 
 import sys
-import os
-import json
-import re
-import time
 import logging
 
 try:
@@ -14,29 +10,13 @@ except ImportError:
     sys.exit(1)
 
 from pprint import pprint
-from musebase import transactions, operations
-from musebase.account import PrivateKey, PublicKey, Address
 from muse.storage import configStorage as config
-from muse.muse import Muse
-from muse.block import Block
-from muse.amount import Amount
-from muse.asset import Asset
-from muse.account import Account
-from muse.transactionbuilder import TransactionBuilder
 from prettytable import PrettyTable
-from .ui import (
-    print_permissions,
-    get_terminal,
-    pprintOperation,
-    print_version,
-)
 from .decorators import (
     onlineChain,
     offlineChain,
     unlockWallet
 )
-from click_datetime import Datetime
-from datetime import datetime
 from .main import main
 from . import (
     account,
@@ -97,6 +77,7 @@ def configuration():
     type=click.File('r'))
 @unlockWallet
 def sign(ctx, filename):
+    from muse.transactionbuilder import TransactionBuilder
     if filename:
         tx = filename.read()
     else:
@@ -118,6 +99,7 @@ def sign(ctx, filename):
     type=click.File('r'))
 @unlockWallet
 def broadcast(ctx, filename):
+    from muse.transactionbuilder import TransactionBuilder
     if filename:
         tx = filename.read()
     else:
@@ -143,6 +125,7 @@ def broadcast(ctx, filename):
     help="The number of keys to derive"
 )
 def randomwif(prefix, num):
+    from musebase.account import PrivateKey
     t = PrettyTable(["wif", "pubkey"])
     for n in range(0, num):
         wif = PrivateKey()
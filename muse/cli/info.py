@@ -3,16 +3,18 @@ import json
 import click
 from pprint import pprint
 from prettytable import PrettyTable
-from muse.block import Block
-from muse.account import Account
 from muse.asset import Asset
 from muse.storage import configStorage as config
 from .decorators import (
     onlineChain,
     unlockWallet
 )
+from .ui import render_kv
 from .main import main
 
+_RE_PUBKEY = re.compile(r"^MUSE.{48,55}$")
+_RE_ACCOUNT_NAME = re.compile(r"^[a-zA-Z0-9._\-]{2,64}$")
+
 
 @main.command()
 @click.pass_context
@@ -26,57 +28,79 @@ def info(ctx, objects):
     """ Obtain all kinds of information
     """
     if not objects:
-        t = PrettyTable(["Key", "Value"])
-        t.align = "l"
         info = ctx.muse.rpc.get_dynamic_global_properties()
-        for key in info:
-            t.add_row([key, info[key]])
-        click.echo(t.get_string(sortby="Key"))
+        for line in render_kv(sorted(info.items())):
+            click.echo(line)
 
+    # Classify all inputs first and accumulate the lookups in a single
+    # JSON-RPC batch request so that we pay one websocket round-trip
+    # for all objects instead of one per object
+    batch = ctx.muse.rpc.batch()
+    classified = []
     for obj in objects:
         # Block
-        if re.match("^[0-9]*$", obj):
-            block = Block(obj, muse_instance=ctx.muse)
+        if obj.isdigit():
+            classified.append(("block", obj, batch.get_block(obj)))
+        # Object Id
+        elif len(obj.split(".")) == 3:
+            classified.append(("object", obj, batch.get_objects([obj])))
+        # Asset
+        elif obj.upper() == obj:
+            classified.append(("asset", obj, None))
+        # Public Key
+        elif _RE_PUBKEY.match(obj):
+            classified.append(("pubkey", obj, None))
+        # Account name
+        elif _RE_ACCOUNT_NAME.match(obj):
+            classified.append((
+                "account", obj, batch.get_full_accounts([obj], False)))
+        else:
+            classified.append((None, obj, None))
+
+    results = batch.execute()
+
+    for kind, obj, pos in classified:
+        # Block
+        if kind == "block":
+            block = results[pos]
             if block:
-                t = PrettyTable(["Key", "Value"])
-                t.align = "l"
-                for key in sorted(block):
-                    value = block[key]
-                    if key == "transactions":
-                        value = json.dumps(value, indent=4)
-                    t.add_row([key, value])
-                click.echo(t)
+                rows = [
+                    (key, json.dumps(value, indent=4)
+                     if key == "transactions" else value)
+                    for key, value in sorted(block.items())
+                ]
+                for line in render_kv(rows):
+                    click.echo(line)
             else:
                 click.echo("Block number %s unknown" % obj)
         # Object Id
-        elif len(obj.split(".")) == 3:
-            data = ctx.muse.rpc.get_object(obj)
+        elif kind == "object":
+            data = results[pos][0]
             if data:
-                t = PrettyTable(["Key", "Value"])
-                t.align = "l"
-                for key in sorted(data):
-                    value = data[key]
-                    if isinstance(value, dict) or isinstance(value, list):
-                        value = json.dumps(value, indent=4)
-                    t.add_row([key, value])
-                click.echo(t)
+                rows = [
+                    (key, json.dumps(value, indent=4)
+                     if isinstance(value, (dict, list))
+                     else value)
+                    for key, value in sorted(data.items())
+                ]
+                for line in render_kv(rows):
+                    click.echo(line)
             else:
                 click.echo("Object %s unknown" % obj)
 
         # Asset
-        elif obj.upper() == obj:
+        elif kind == "asset":
             data = Asset(obj)
-            t = PrettyTable(["Key", "Value"])
-            t.align = "l"
-            for key in sorted(data):
-                value = data[key]
-                if isinstance(value, dict):
-                    value = json.dumps(value, indent=4)
-                t.add_row([key, value])
-            click.echo(t)
+            rows = [
+                (key, json.dumps(value, indent=4)
+                 if isinstance(value, dict) else value)
+                for key, value in sorted(data.items())
+            ]
+            for line in render_kv(rows):
+                click.echo(line)
 
         # Public Key
-        elif re.match("^MUSE.{48,55}$", obj):
+        elif kind == "pubkey":
             account = ctx.muse.wallet.getAccountFromPublicKey(obj)
             if account:
                 t = PrettyTable(["Account"])
@@ -84,20 +108,24 @@ def info(ctx, objects):
                 t.add_row([account])
                 click.echo(t)
             else:
-                click.echo("Public Key not known" % obj)
+                click.echo("Public Key %s not known" % obj)
 
         # Account name
-        elif re.match("^[a-zA-Z0-9\-\._]{2,64}$", obj):
-            account = Account(obj, full=True)
-            if account:
-                t = PrettyTable(["Key", "Value"])
-                t.align = "l"
-                for key in sorted(account):
-                    value = account[key]
-                    if isinstance(value, dict) or isinstance(value, list):
-                        value = json.dumps(value, indent=4)
-                    t.add_row([key, value])
-                click.echo(t)
+        elif kind == "account":
+            full = results[pos]
+            if full:
+                account = dict(full[0][1]["account"])
+                for k, v in full[0][1].items():
+                    if k != "account":
+                        account[k] = v
+                rows = [
+                    (key, json.dumps(value, indent=4)
+                     if isinstance(value, (dict, list))
+                     else value)
+                    for key, value in sorted(account.items())
+                ]
+                for line in render_kv(rows):
+                    click.echo(line)
             else:
                 click.echo("Account %s unknown" % obj)
         else:
@@ -1,32 +1,84 @@
-import os
 import json
-import sys
-from muse.account import Account
 from prettytable import PrettyTable, ALL as allBorders
-import pkg_resources
 import click
 import logging
 log = logging.getLogger(__name__)
 
 
+_version = None
+
+
 def print_version(ctx, param, value):
     if not value or ctx.resilient_parsing:
         return
+    # Resolving the installed version is expensive (scans sys.path and
+    # parses the package metadata), so only do it when --version is
+    # actually passed, and only once
+    global _version
+    if _version is None:
+        try:
+            from importlib.metadata import version
+            _version = version("muse")
+        except ImportError:
+            import pkg_resources
+            _version = pkg_resources.require("muse")[0].version
     click.echo('{prog} {version}'.format(
-        prog=pkg_resources.require("muse")[0].project_name,
-        version=pkg_resources.require("muse")[0].version
+        prog="muse",
+        version=_version
     ))
     ctx.exit()
 
 
+def render_kv(rows):
+    """ Render two-column key/value rows without PrettyTable's per-row
+        overhead: the column widths are computed in a single pass and
+        each line is yielded as soon as it is formatted, so the output
+        can be streamed instead of being built up in memory.
+
+        :param list rows: list of ``(key, value)`` tuples
+    """
+    rows = [
+        (str(key), str(value).split("\n"))
+        for key, value in rows
+    ]
+    key_width = max([len("Key")] + [len(key) for key, _ in rows])
+    value_width = max(
+        [len("Value")] +
+        [len(line) for _, lines in rows for line in lines])
+    separator = "+-%s-+-%s-+" % ("-" * key_width, "-" * value_width)
+    yield separator
+    yield "| %-*s | %-*s |" % (key_width, "Key", value_width, "Value")
+    yield separator
+    for key, lines in rows:
+        for i, line in enumerate(lines):
+            yield "| %-*s | %-*s |" % (
+                key_width, key if i == 0 else "",
+                value_width, line)
+    yield separator
+
+
 def print_permissions(account):
+    # Resolve all authority accounts with a single multi-id lookup
+    # instead of one Account() round-trip per authority entry
+    ids = [
+        authority[0]
+        for permission in ["owner", "active"]
+        for authority in account[permission]["account_auths"]
+    ]
+    names = {}
+    if ids:
+        for data in account.muse.rpc.get_objects(ids):
+            if data:
+                names[data["id"]] = data["name"]
+
     t = PrettyTable(["Permission", "Threshold", "Key/Account"], hrules=allBorders)
     t.align = "r"
     for permission in ["owner", "active"]:
         auths = []
         # account auths:
         for authority in account[permission]["account_auths"]:
-            auths.append("%s (%d)" % (Account(authority[0])["name"], authority[1]))
+            auths.append("%s (%d)" % (
+                names.get(authority[0], authority[0]), authority[1]))
         # key auths:
         for authority in account[permission]["key_auths"]:
             auths.append("%s (%d)" % (authority[0], authority[1]))
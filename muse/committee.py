@@ -1,5 +1,6 @@
 from muse.instance import shared_muse_instance
 from .account import Account
+from .cache import TTLCache
 from .exceptions import CommitteeMemberDoesNotExistsException
 
 
@@ -11,6 +12,11 @@ class Committee(dict):
         :param bool lazy: Use lazy loading
 
     """
+
+    committee_cache = TTLCache(maxsize=8192, ttl=30)
+
+    __slots__ = ("muse", "member", "cached")
+
     def __init__(
         self,
         member,
@@ -21,10 +27,13 @@ class Committee(dict):
         self.refresh()
 
     def refresh(self):
-        account = Account(self.member)
-        member = self.muse.rpc.get_committee_member_by_account(account["id"])
+        member = Committee.committee_cache.get(self.member)
         if not member:
-            raise CommitteeMemberDoesNotExistsException
+            account = Account(self.member, muse_instance=self.muse)
+            member = self.muse.rpc.get_committee_member_by_account(account["id"])
+            if not member:
+                raise CommitteeMemberDoesNotExistsException
+            Committee.committee_cache[self.member] = member
         super(Committee, self).__init__(member)
         self.cached = True
 
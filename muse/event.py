@@ -9,6 +9,9 @@ class Event(dict):
         :param muse muse_instance: muse() instance to use when accesing a RPC
 
     """
+
+    __slots__ = ("muse", "identifier", "cached")
+
     def __init__(
         self,
         identifier,
@@ -23,7 +26,8 @@ class Event(dict):
             if not lazy:
                 self.refresh()
         elif isinstance(identifier, dict):
-            self.cached = False
+            # Data was just supplied, no need to refresh on first access
+            self.cached = True
             self.identifier = identifier.get("id")
             super(Event, self).__init__(identifier)
 
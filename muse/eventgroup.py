@@ -9,6 +9,9 @@ class EventGroup(dict):
         :param muse muse_instance: muse() instance to use when accesing a RPC
 
     """
+
+    __slots__ = ("muse", "identifier", "cached")
+
     def __init__(
         self,
         identifier,
@@ -23,7 +26,8 @@ class EventGroup(dict):
             if not lazy:
                 self.refresh()
         elif isinstance(identifier, dict):
-            self.cached = False
+            # Data was just supplied, no need to refresh on first access
+            self.cached = True
             self.identifier = identifier.get("id")
             super(EventGroup, self).__init__(identifier)
 
@@ -64,7 +68,39 @@ class EventGroups(list):
         self.muse = muse_instance or shared_muse_instance()
         self.eventgroups = self.muse.rpc.list_event_groups(sport_id)
 
+        # Some API nodes return bare object ids instead of full
+        # objects; hydrate those with a single multi-id get_objects
+        # call instead of one lazy refresh round-trip each
+        ids = [x for x in self.eventgroups if isinstance(x, str)]
+        if ids:
+            datas = iter(self.muse.rpc.get_objects(ids))
+            self.eventgroups = [
+                next(datas) if isinstance(x, str) else x
+                for x in self.eventgroups
+            ]
+
         super(EventGroups, self).__init__([
             EventGroup(x, lazy=True, muse_instance=muse_instance)
             for x in self.eventgroups
         ])
+
+    def fetch_all_async(self, max_tasks=10):
+        """ Re-fetch all event groups concurrently over a single
+            websocket connection (see :mod:`muse.rpc_async`) and
+            hydrate the list in one go, instead of paying one blocking
+            round-trip per group on lazy ``refresh()``.
+
+            :param int max_tasks: Maximum number of concurrent calls
+        """
+        from .rpc_async import get_objects
+        groups = []
+        for data in get_objects(
+            self.muse.rpc.url,
+            [x["id"] for x in self.eventgroups],
+            max_tasks=max_tasks
+        ):
+            group = EventGroup(data, lazy=True, muse_instance=self.muse)
+            group.cached = True
+            groups.append(group)
+        self[:] = groups
+        return self
@@ -1,3 +1,5 @@
+import atexit
+
 import muse as dct
 
 _shared_muse_instance = None
@@ -7,13 +9,28 @@ def shared_muse_instance():
     """ This method will initialize ``_shared_muse_instance`` and return it.
         The purpose of this method is to have offer single default
         muse instance that can be reused by multiple classes.
+
+        The instance keeps one long-lived websocket connection that is
+        shared by all classes and closed on interpreter exit.
     """
     global _shared_muse_instance
     if not _shared_muse_instance:
-        _shared_muse_instance = dct.muse()
+        _shared_muse_instance = dct.Muse()
+        atexit.register(_close_shared_muse_instance)
     return _shared_muse_instance
 
 
+def _close_shared_muse_instance():
+    """ Close the websocket of the shared instance on exit
+    """
+    global _shared_muse_instance
+    if _shared_muse_instance and _shared_muse_instance.rpc:
+        try:
+            _shared_muse_instance.rpc.ws.close()
+        except Exception:
+            pass
+
+
 def set_shared_muse_instance(muse_instance):
     """ This method allows us to override default muse instance for all users of
         ``_shared_muse_instance``.
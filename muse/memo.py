@@ -1,5 +1,6 @@
 from muse.instance import shared_muse_instance
-import random
+import os
+import secrets
 from musebase import memo as MUSEMemo
 from musebase.account import PrivateKey, PublicKey
 from .account import Account
@@ -42,6 +43,47 @@ class Memo(object):
         self.to_account = Account(to_account, muse_instance=self.muse)
         self.from_account = Account(from_account, muse_instance=self.muse)
 
+        # The chain prefix and the key objects never change for a given
+        # sender/recipient pair, so resolve the prefix once here and
+        # derive the key objects lazily on first use
+        self.chain_prefix = self.muse.rpc.chain_params["prefix"]
+        self._encrypt_privkey = None
+        self._encrypt_pubkey = None
+        self._decrypt_privkey = None
+        self._decrypt_pubkey = None
+
+    def _encryption_keys(self):
+        """ Derive (once) and return the key pair used for encrypting
+        """
+        if not self._encrypt_privkey:
+            memo_wif = self.muse.wallet.getPrivateKeyForPublicKey(
+                self.from_account["options"]["memo_key"]
+            )
+            if not memo_wif:
+                raise MissingKeyError("Memo key for %s missing!" % self.from_account["name"])
+            self._encrypt_privkey = PrivateKey(memo_wif)
+            self._encrypt_pubkey = PublicKey(
+                self.to_account["options"]["memo_key"],
+                prefix=self.chain_prefix
+            )
+        return self._encrypt_privkey, self._encrypt_pubkey
+
+    def _decryption_keys(self):
+        """ Derive (once) and return the key pair used for decrypting
+        """
+        if not self._decrypt_privkey:
+            memo_wif = self.muse.wallet.getPrivateKeyForPublicKey(
+                self.to_account["options"]["memo_key"]
+            )
+            if not memo_wif:
+                raise MissingKeyError("Memo key for %s missing!" % self.to_account["name"])
+            self._decrypt_privkey = PrivateKey(memo_wif)
+            self._decrypt_pubkey = PublicKey(
+                self.from_account["options"]["memo_key"],
+                prefix=self.chain_prefix
+            )
+        return self._decrypt_privkey, self._decrypt_pubkey
+
     def encrypt(self, memo):
         """ Encrypt a memo
 
@@ -52,19 +94,12 @@ class Memo(object):
         if not memo:
             return None
 
-        nonce = str(random.getrandbits(64))
-        memo_wif = self.muse.wallet.getPrivateKeyForPublicKey(
-            self.from_account["options"]["memo_key"]
-        )
-        if not memo_wif:
-            raise MissingKeyError("Memo key for %s missing!" % self.from_account["name"])
+        nonce = str(int.from_bytes(secrets.token_bytes(8), "big"))
+        privkey, pubkey = self._encryption_keys()
 
         enc = MUSEMemo.encode_memo(
-            PrivateKey(memo_wif),
-            PublicKey(
-                self.to_account["options"]["memo_key"],
-                prefix=self.muse.rpc.chain_params["prefix"]
-            ),
+            privkey,
+            pubkey,
             nonce,
             memo
         )
@@ -76,6 +111,34 @@ class Memo(object):
             "to": self.to_account["options"]["memo_key"]
         }
 
+    def encrypt_many(self, memos):
+        """ Encrypt many memos in one go
+
+            :param list memos: clear text memo messages
+            :returns: list of encrypted memos
+            :rtype: list
+
+            The keys are resolved only once and the nonces for all
+            memos are drawn from the OS with a single ``os.urandom``
+            call instead of one syscall per memo.
+        """
+        if not memos:
+            return []
+
+        privkey, pubkey = self._encryption_keys()
+
+        nonces = memoryview(os.urandom(8 * len(memos)))
+        encrypted = []
+        for i, memo in enumerate(memos):
+            nonce = str(int.from_bytes(nonces[i * 8:(i + 1) * 8], "big"))
+            encrypted.append({
+                "message": MUSEMemo.encode_memo(privkey, pubkey, nonce, memo),
+                "nonce": nonce,
+                "from": self.from_account["options"]["memo_key"],
+                "to": self.to_account["options"]["memo_key"]
+            })
+        return encrypted
+
     def decrypt(self, memo):
         """ Decrypt a memo
 
@@ -86,28 +149,11 @@ class Memo(object):
         if not memo:
             return None
 
-        memo_wif = self.muse.wallet.getPrivateKeyForPublicKey(
-            self.to_account["options"]["memo_key"]
-        )
-        if not memo_wif:
-            raise MissingKeyError("Memo key for %s missing!" % self.to_account["name"])
-
         # TODO: Use pubkeys of the message, not pubkeys of account!
-        print(
-            PrivateKey(memo_wif),
-            PublicKey(
-                self.from_account["options"]["memo_key"],
-                prefix=self.muse.rpc.chain_params["prefix"]
-            ),
-            memo.get("nonce"),
-            memo.get("message")
-        )
+        privkey, pubkey = self._decryption_keys()
         return MUSEMemo.decode_memo(
-            PrivateKey(memo_wif),
-            PublicKey(
-                self.from_account["options"]["memo_key"],
-                prefix=self.muse.rpc.chain_params["prefix"]
-            ),
+            privkey,
+            pubkey,
             memo.get("nonce"),
             memo.get("message")
         )
@@ -3,9 +3,10 @@ import logging
 import random
 import re
 from datetime import datetime, timedelta
+from itertools import chain
 
 from museapi.node import MuseNodeRPC
-from musebase.account import PrivateKey, PublicKey
+from musebase.account import PasswordKey, PrivateKey, PublicKey
 from musebase import transactions, operations
 from .asset import Asset
 from .account import Account
@@ -16,9 +17,13 @@ from .storage import configStorage as config
 from .exceptions import (
     AccountExistsException,
     AccountDoesNotExistsException,
+    CommitteeMemberDoesNotExistsException,
     InsufficientAuthorityError,
     MissingKeyError,
+    ProposalDoesNotExistException,
+    WitnessDoesNotExistsException,
 )
+from .memo import Memo
 from .wallet import Wallet
 from .transactionbuilder import TransactionBuilder
 from .utils import formatTime
@@ -26,6 +31,37 @@ from .utils import formatTime
 log = logging.getLogger(__name__)
 
 
+#: Permissions that can be modified through allow()/disallow()
+_VALID_PERMISSIONS = frozenset(["owner", "active"])
+
+#: Valid graphene account names (create_account rejects invalid names
+#: locally instead of paying an RPC only to have the node refuse them)
+_RE_ACCOUNT_NAME = re.compile(r"^[a-z][a-z0-9\.-]{0,62}$")
+
+#: Prefixed base58 public key, e.g. "MUSE5x...". Both known chain
+#: prefixes start with "MUSE" and "1" is part of the base58 alphabet,
+#: so a single pattern covers mainnet and testnet
+_RE_PUBKEY = re.compile(r"^MUSE[1-9A-HJ-NP-Za-km-z]{48,55}$")
+
+
+def _is_witness_vote(vote_id):
+    """ vote_ids are "kind:id" strings; witness votes are kind 1 """
+    return vote_id.startswith("1:")
+
+
+def _is_committee_vote(vote_id):
+    """ vote_ids are "kind:id" strings; committee votes are kind 0 """
+    return vote_id.startswith("0:")
+
+
+def _vote_sort_key(vote_id):
+    """ Order votes numerically by (kind, id) so the serialized
+        transaction bytes are deterministic across calls
+    """
+    kind, instance = vote_id.split(":")
+    return (int(kind), int(instance))
+
+
 class Muse(object):
     """ Connect to the muse network.
 
@@ -94,6 +130,13 @@ class Muse(object):
         This class also deals with edits, votes and reading content.
     """
 
+    #: Pool of established node connections, keyed by
+    #: (node, rpcuser, rpcpassword). The transport is a websocket, so
+    #: reusing a connected MuseNodeRPC saves the TCP/TLS/websocket
+    #: handshake and the chain detection calls that every fresh
+    #: connection pays.
+    rpc_pool = {}
+
     def __init__(self,
                  node="",
                  rpcuser="",
@@ -121,16 +164,34 @@ class Muse(object):
 
         # Store config for access through other Classes
         self.config = config
+        # ``config`` is SQLite-backed, so read the default account once
+        # instead of two queries per method call
+        self._default_account = config.get("default_account")
 
         if not self.offline:
             self.connect(node=node,
                          rpcuser=rpcuser,
                          rpcpassword=rpcpassword,
                          **kwargs)
+            # Read once; every op-building method needs the chain
+            # prefix at least once (PublicKey formatting and op dicts)
+            self._prefix = self.rpc.chain_params["prefix"]
+            # Common keys of every operation dict built below: the
+            # zero fee (filled in by get_required_fees later) and the
+            # chain prefix the serializer needs for pubkey fields
+            self._op_base = {
+                "fee": {"amount": 0, "asset_id": "1.3.0"},
+                "prefix": self._prefix,
+            }
 
         self.wallet = Wallet(self.rpc, **kwargs)
         self.txbuffer = TransactionBuilder(muse_instance=self)
 
+        # Per-instance memoization of resolved accounts (on top of the
+        # short-lived class-level cache in ``Account``), see
+        # :func:`Muse._get_account`
+        self._account_cache = {}
+
     def connect(self,
                 node="",
                 rpcuser="",
@@ -150,7 +211,11 @@ class Muse(object):
         if not rpcpassword and "rpcpassword" in config:
             rpcpassword = config["rpcpassword"]
 
-        self.rpc = MuseNodeRPC(node, rpcuser, rpcpassword, **kwargs)
+        pool_key = (node, rpcuser, rpcpassword)
+        if pool_key not in Muse.rpc_pool:
+            Muse.rpc_pool[pool_key] = MuseNodeRPC(
+                node, rpcuser, rpcpassword, **kwargs)
+        self.rpc = Muse.rpc_pool[pool_key]
 
     def finalizeOp(self, ops, account, permission):
         """ This method obtains the required private keys if present in
@@ -212,7 +277,7 @@ class Muse(object):
         """
         if tx:
             # If tx is provided, we broadcast the tx
-            return TransactionBuilder(tx).broadcast()
+            return TransactionBuilder(tx, muse_instance=self).broadcast()
         else:
             return self.txbuffer.broadcast()
 
@@ -221,6 +286,99 @@ class Muse(object):
         """
         return self.rpc.get_dynamic_global_properties()
 
+    def _resolve_accountname(self, account):
+        """ Fall back to ``default_account`` (read once at init) when
+            no account is given
+
+            :param str account: Account name or id, or ``None``
+        """
+        if not account:
+            account = self._default_account
+        if not account:
+            raise ValueError("You need to provide an account")
+        return account
+
+    def _resolve_account(self, account):
+        """ Combined helper for the common per-method preamble:
+            fall back to ``default_account`` and return the memoized
+            :class:`muse.account.Account`
+
+            :param str account: Account name or id, or ``None``
+        """
+        return self._get_account(self._resolve_accountname(account))
+
+    def _get_account(self, account):
+        """ Return an :class:`muse.account.Account` for ``account``,
+            memoized on this instance so that repeated calls (e.g.
+            ``default_account`` in every transfer) don't redundantly
+            hit the network.
+
+            :param str account: Account name or id, or an already
+                resolved :class:`muse.account.Account`
+        """
+        if isinstance(account, Account):
+            # Already resolved (dicts are unhashable, so it cannot be
+            # used as the cache key itself); warm the cache instead
+            self._account_cache[account["id"]] = account
+            self._account_cache[account["name"]] = account
+            return account
+        if account in self._account_cache:
+            return self._account_cache[account]
+        obj = Account(account, muse_instance=self)
+        self._account_cache[account] = obj
+        self._account_cache[obj["id"]] = obj
+        self._account_cache[obj["name"]] = obj
+        return obj
+
+    def invalidate_account(self, account):
+        """ Drop an account from the per-instance memoization and from
+            the class-level :class:`Account` cache, e.g. after
+            broadcasting an ``Account_update`` that changes it
+
+            :param str account: Account name or id
+        """
+        if isinstance(account, Account):
+            account = account["name"]
+        obj = self._account_cache.pop(account, None)
+        Account.account_cache.pop(account)
+        if obj is not None:
+            self._account_cache.pop(obj.get("id"), None)
+            self._account_cache.pop(obj.get("name"), None)
+            Account.account_cache.pop(obj.get("id"))
+            Account.account_cache.pop(obj.get("name"))
+
+    def prefetch(self, accounts=[], assets=[]):
+        """ Warm the Account and Asset caches with a single batched
+            RPC call instead of one round-trip per lookup. Useful
+            before building many operations (e.g. in bundle mode).
+
+            :param list accounts: Account names or ids to prefetch
+            :param list assets: Asset symbols or ids to prefetch
+        """
+        batch = self.rpc.batch()
+        for account in accounts:
+            if len(account.split(".")) == 3:
+                batch.get_objects([account])
+            else:
+                batch.get_account_by_name(account)
+        for asset in assets:
+            if len(asset.split(".")) == 3:
+                batch.get_objects([asset])
+            else:
+                batch.lookup_asset_symbols([asset])
+        results = batch.execute()
+        for account in results[:len(accounts)]:
+            if isinstance(account, list):
+                account = account[0]
+            if account:
+                Account.account_cache[account["name"]] = account
+                Account.account_cache[account["id"]] = account
+        for asset in results[len(accounts):]:
+            if isinstance(asset, list):
+                asset = asset[0]
+            if asset:
+                Asset.assets_cache[asset["symbol"]] = asset
+
     def create_account(
         self,
         account_name,
@@ -278,8 +436,8 @@ class Muse(object):
             :raises AccountExistsException: if the account already exists on the blockchain
 
         """
-        if not registrar and config["default_account"]:
-            registrar = config["default_account"]
+        if not registrar and self._default_account:
+            registrar = self._default_account
         if not registrar:
             raise ValueError(
                 "Not registrar account given. Define it with " +
@@ -288,44 +446,47 @@ class Muse(object):
             raise ValueError(
                 "You cannot use 'password' AND provide keys!"
             )
+        # Fail fast on local input errors before touching the network
+        if not _RE_ACCOUNT_NAME.match(account_name):
+            raise ValueError(
+                "Invalid account name: %s" % account_name
+            )
+        if not password and not (owner_key and active_key and memo_key):
+            raise ValueError(
+                "Call incomplete! Provide either a password or public keys!"
+            )
+        if owner_key and active_key and memo_key:
+            active_pubkey = PublicKey(active_key, prefix=self._prefix)
+            owner_pubkey = PublicKey(owner_key, prefix=self._prefix)
+            memo_pubkey = PublicKey(memo_key, prefix=self._prefix)
 
-        try:
-            Account(account_name, muse_instance=self)
+        if self.rpc.lookup_account_names([account_name])[0] is not None:
             raise AccountExistsException
-        except:
-            pass
 
-        referrer = Account(referrer, muse_instance=self)
-        registrar = Account(registrar, muse_instance=self)
+        referrer = self._get_account(referrer)
+        registrar = self._get_account(registrar)
 
         " Generate new keys from password"
-        from musebase.account import PasswordKey, PublicKey
         if password:
-            active_key = PasswordKey(account_name, password, role="active")
-            owner_key = PasswordKey(account_name, password, role="owner")
-            memo_key = PasswordKey(account_name, password, role="memo")
-            active_pubkey = active_key.get_public_key()
-            owner_pubkey = owner_key.get_public_key()
-            memo_pubkey = memo_key.get_public_key()
+            active_key, owner_key, memo_key = PasswordKey.derive_all(
+                account_name, password)
+            # Derive each private key once and take the public keys
+            # from it, instead of hashing the passphrase a second time
+            # through get_public_key()
             active_privkey = active_key.get_private_key()
-            # owner_privkey   = owner_key.get_private_key()
+            owner_privkey = owner_key.get_private_key()
             memo_privkey = memo_key.get_private_key()
+            active_pubkey = active_privkey.pubkey
+            owner_pubkey = owner_privkey.pubkey
+            memo_pubkey = memo_privkey.pubkey
             # store private keys
             if storekeys:
                 # self.wallet.addPrivateKey(owner_privkey)
                 self.wallet.addPrivateKey(active_privkey)
                 self.wallet.addPrivateKey(memo_privkey)
-        elif (owner_key and active_key and memo_key):
-            active_pubkey = PublicKey(active_key, prefix=self.rpc.chain_params["prefix"])
-            owner_pubkey = PublicKey(owner_key, prefix=self.rpc.chain_params["prefix"])
-            memo_pubkey = PublicKey(memo_key, prefix=self.rpc.chain_params["prefix"])
-        else:
-            raise ValueError(
-                "Call incomplete! Provide either a password or public keys!"
-            )
-        owner = format(owner_pubkey, self.rpc.chain_params["prefix"])
-        active = format(active_pubkey, self.rpc.chain_params["prefix"])
-        memo = format(memo_pubkey, self.rpc.chain_params["prefix"])
+        owner = format(owner_pubkey, self._prefix)
+        active = format(active_pubkey, self._prefix)
+        memo = format(memo_pubkey, self._prefix)
 
         owner_key_authority = [[owner, 1]]
         active_key_authority = [[active, 1]]
@@ -338,6 +499,28 @@ class Muse(object):
         for k in additional_active_keys:
             active_key_authority.append([k, 1])
 
+        # The additional account authorities are independent lookups;
+        # resolve them concurrently over a single websocket (see
+        # :mod:`muse.rpc_async`) and warm the account cache so the
+        # ``Account()`` constructions below don't hit the network again
+        additional = (list(additional_owner_accounts) +
+                      list(additional_active_accounts))
+        if additional:
+            from . import rpc_async
+            datas = rpc_async.call_many(self.rpc.url, [
+                ("get_objects", [[k]])
+                if len(k.split(".")) == 3
+                else ("get_account_by_name", [k])
+                for k in additional
+            ])
+            for k, data in zip(additional, datas):
+                if isinstance(data, list):
+                    data = data[0] if data else None
+                if not data:
+                    raise AccountDoesNotExistsException(k)
+                Account.account_cache[data["name"]] = data
+                Account.account_cache[data["id"]] = data
+
         for k in additional_owner_accounts:
             addaccount = Account(k, muse_instance=self)
             owner_accounts_authority.append([addaccount["id"], 1])
@@ -346,10 +529,10 @@ class Muse(object):
             active_accounts_authority.append([addaccount["id"], 1])
 
         # voting account
-        voting_account = Account(proxy_account or "proxy-to-self", muse_instance=self)
+        voting_account = self._get_account(proxy_account or "proxy-to-self")
 
         op = {
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "registrar": registrar["id"],
             "referrer": referrer["id"],
             "referrer_percent": referrer_percent * 100,
@@ -370,11 +553,45 @@ class Muse(object):
                         "extensions": []
                         },
             "extensions": {},
-            "prefix": self.rpc.chain_params["prefix"]
         }
         op = operations.Account_create(**op)
         return self.finalizeOp(op, registrar, "active")
 
+    def create_many(self, specs, account=None):
+        """ Append many create operations to the transaction buffer in
+            one tight loop. This needs to be **proposed** and requires
+            ``bundle=True`` so all operations end up in one
+            transaction.
+
+            :param list specs: list of ``(kind, args)`` or
+                ``(kind, args, kwargs)`` tuples, where ``kind`` is one
+                of ``sport``, ``competitor``, ``event_group``,
+                ``event``, ``betting_market_group`` or
+                ``betting_market``
+            :param str account: (optional) the account to allow access
+                to (defaults to ``default_account``)
+
+            The signing account is resolved once for the whole batch
+            (subsequent lookups are served from the account cache);
+            broadcast the result with ``txbuffer.broadcast()``.
+        """
+        assert self.bundle, "'create_many' requires bundle=True"
+        builders = {
+            "sport": self.sport_create,
+            "competitor": self.competitor_create,
+            "event_group": self.event_group_create,
+            "event": self.event_create,
+            "betting_market_group": self.betting_market_group_create,
+            "betting_market": self.betting_market_create,
+        }
+        for spec in specs:
+            kind, args = spec[0], spec[1]
+            kwargs = dict(spec[2]) if len(spec) > 2 else {}
+            if account and "account" not in kwargs:
+                kwargs["account"] = account
+            builders[kind](*args, **kwargs)
+        return self.txbuffer
+
     def transfer(self, to, amount, asset, memo="", account=None):
         """ Transfer an asset to another account.
 
@@ -384,16 +601,9 @@ class Muse(object):
             :param str memo: (optional) Memo, may begin with `#` for encrypted messaging
             :param str account: (optional) the source account for the transfer if not ``default_account``
         """
-        from .memo import Memo
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-
-        account = Account(account, muse_instance=self)
+        account = self._resolve_account(account)
         amount = Amount(amount, asset, muse_instance=self)
-        to = Account(to, muse_instance=self)
+        to = self._get_account(to)
 
         memoObj = Memo(
             from_account=account,
@@ -402,7 +612,7 @@ class Muse(object):
         )
 
         op = operations.Transfer(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "from": account["id"],
             "to": to["id"],
             "amount": {
@@ -410,7 +620,6 @@ class Muse(object):
                 "asset_id": amount.asset["id"]
             },
             "memo": memoObj.encrypt(memo),
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account, "active")
 
@@ -421,11 +630,9 @@ class Muse(object):
             :param dict authority: An authority of an account
             :raises ValueError: if the threshold is set too high
         """
-        weights = 0
-        for a in authority["account_auths"]:
-            weights += a[1]
-        for a in authority["key_auths"]:
-            weights += a[1]
+        weights = sum(w for _, w in chain(
+            authority["account_auths"],
+            authority["key_auths"]))
         if authority["weight_threshold"] > weights:
             raise ValueError("Threshold too restrictive!")
 
@@ -446,51 +653,53 @@ class Muse(object):
             :param int threshold: The threshold that needs to be reached
                 by signatures to be able to interact
         """
-        from copy import deepcopy
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_accountname(account)
 
-        if permission not in ["owner", "active"]:
+        if permission not in _VALID_PERMISSIONS:
             raise ValueError(
                 "Permission needs to be either 'owner', or 'active"
             )
-        account = Account(account, muse_instance=self)
+        account = self._get_account(account)
 
         if not weight:
             weight = account[permission]["weight_threshold"]
 
-        authority = deepcopy(account[permission])
-        try:
-            pubkey = PublicKey(foreign, prefix=self.rpc.chain_params["prefix"])
+        # Copy the authority without mutating the (cached) account;
+        # the nested [key, weight] pairs are only ever replaced, never
+        # modified in place, so shallow copies of the lists suffice
+        authority = {
+            "account_auths": list(account[permission]["account_auths"]),
+            "key_auths": list(account[permission]["key_auths"]),
+            "weight_threshold": account[permission]["weight_threshold"],
+        }
+        if _RE_PUBKEY.match(str(foreign)):
+            pubkey = PublicKey(foreign, prefix=self._prefix)
             authority["key_auths"].append([
                 str(pubkey),
                 weight
             ])
-        except:
+        else:
             try:
-                foreign_account = Account(foreign, muse_instance=self)
-                authority["account_auths"].append([
-                    foreign_account["id"],
-                    weight
-                ])
-            except:
+                foreign_account = self._get_account(foreign)
+            except AccountDoesNotExistsException:
                 raise ValueError(
                     "Unknown foreign account or invalid public key"
                 )
+            authority["account_auths"].append([
+                foreign_account["id"],
+                weight
+            ])
         if threshold:
             authority["weight_threshold"] = threshold
             self._test_weights_treshold(authority)
 
         op = operations.Account_update(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account": account["id"],
             permission: authority,
             "extensions": {},
-            "prefix": self.rpc.chain_params["prefix"]
         })
+        self.invalidate_account(account["name"])
         if permission == "owner":
             return self.finalizeOp(op, account["name"], "owner")
         else:
@@ -509,42 +718,46 @@ class Muse(object):
             :param int threshold: The threshold that needs to be reached
                 by signatures to be able to interact
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_accountname(account)
 
-        if permission not in ["owner", "active"]:
+        if permission not in _VALID_PERMISSIONS:
             raise ValueError(
                 "Permission needs to be either 'owner', or 'active"
             )
-        account = Account(account, muse_instance=self)
-        authority = account[permission]
+        account = self._get_account(account)
+
+        # Copy the authority without mutating the (cached) account;
+        # the nested [key, weight] pairs are only ever replaced, never
+        # modified in place, so shallow copies of the lists suffice
+        authority = {
+            "account_auths": list(account[permission]["account_auths"]),
+            "key_auths": list(account[permission]["key_auths"]),
+            "weight_threshold": account[permission]["weight_threshold"],
+        }
 
-        try:
-            pubkey = PublicKey(foreign, prefix=self.rpc.chain_params["prefix"])
-            affected_items = list(
-                filter(lambda x: x[0] == str(pubkey),
-                       authority["key_auths"]))
-            authority["key_auths"] = list(filter(
-                lambda x: x[0] != str(pubkey),
-                authority["key_auths"]
-            ))
-        except:
+        if _RE_PUBKEY.match(str(foreign)):
+            removed = str(PublicKey(foreign, prefix=self._prefix))
+            affected_auths = "key_auths"
+        else:
             try:
-                foreign_account = Account(foreign, muse_instance=self)
-                affected_items = list(
-                    filter(lambda x: x[0] == foreign_account["id"],
-                           authority["account_auths"]))
-                authority["account_auths"] = list(filter(
-                    lambda x: x[0] != foreign_account["id"],
-                    authority["account_auths"]
-                ))
-            except:
+                foreign_account = self._get_account(foreign)
+            except AccountDoesNotExistsException:
                 raise ValueError(
                     "Unknown foreign account or unvalid public key"
                 )
+            removed = foreign_account["id"]
+            affected_auths = "account_auths"
+
+        # Split the authority entries in a single pass instead of two
+        # filter() scans
+        affected_items = []
+        kept = []
+        for auth in authority[affected_auths]:
+            if auth[0] == removed:
+                affected_items.append(auth)
+            else:
+                kept.append(auth)
+        authority[affected_auths] = kept
 
         removed_weight = affected_items[0][1]
 
@@ -565,11 +778,12 @@ class Muse(object):
             self._test_weights_treshold(authority)
 
         op = operations.Account_update(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account": account["id"],
             permission: authority,
             "extensions": {}
         })
+        self.invalidate_account(account["name"])
         if permission == "owner":
             return self.finalizeOp(op, account["name"], "owner")
         else:
@@ -585,24 +799,91 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_accountname(account)
 
-        PublicKey(key, prefix=self.rpc.chain_params["prefix"])
+        PublicKey(key, prefix=self._prefix)
 
-        account = Account(account, muse_instance=self)
+        account = self._get_account(account)
         account["options"]["memo_key"] = key
         op = operations.Account_update(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account": account["id"],
             "new_options": account["options"],
             "extensions": {}
         })
+        self.invalidate_account(account["name"])
         return self.finalizeOp(op, account["name"], "active")
 
+    def _resolve_witnesses(self, witnesses):
+        """ Resolve many witnesses with at most two batched RPC
+            round-trips instead of one (or two) calls per witness
+
+            :param list witnesses: list of witness names or ids
+        """
+        batch = self.rpc.batch()
+        entries = []
+        for witness in witnesses:
+            parts = str(witness).split(".")
+            if len(parts) == 3 and parts[1] == "6":
+                entries.append(("object", batch.get_objects([witness])))
+            elif len(parts) == 3 and parts[1] == "2":
+                entries.append(
+                    ("account", batch.get_witness_by_account(witness)))
+            else:
+                entries.append(("name", batch.get_account_by_name(witness)))
+        results = batch.execute()
+
+        # Second round-trip for witnesses given by account name
+        batch = self.rpc.batch()
+        for kind, pos in entries:
+            if kind == "name":
+                account = results[pos]
+                if not account:
+                    raise AccountDoesNotExistsException(witnesses)
+                batch.get_witness_by_account(account["id"])
+        by_name = iter(batch.execute())
+
+        resolved = []
+        for kind, pos in entries:
+            if kind == "object":
+                witness = results[pos][0]
+            elif kind == "account":
+                witness = results[pos]
+            else:
+                witness = next(by_name)
+            if not witness:
+                raise WitnessDoesNotExistsException
+            resolved.append(witness)
+        return resolved
+
+    def _resolve_committee_members(self, members):
+        """ Resolve many committee members with two batched RPC
+            round-trips instead of two calls per member
+
+            :param list members: list of account names or ids
+        """
+        batch = self.rpc.batch()
+        for member in members:
+            if len(str(member).split(".")) == 3:
+                batch.get_objects([member])
+            else:
+                batch.get_account_by_name(member)
+        accounts = batch.execute()
+
+        batch = self.rpc.batch()
+        for account in accounts:
+            if isinstance(account, list):
+                account = account[0]
+            if not account:
+                raise AccountDoesNotExistsException(members)
+            batch.get_committee_member_by_account(account["id"])
+
+        resolved = batch.execute()
+        for member in resolved:
+            if not member:
+                raise CommitteeMemberDoesNotExistsException
+        return resolved
+
     def approvewitness(self, witnesses, account=None):
         """ Approve a witness
 
@@ -610,34 +891,27 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account, muse_instance=self)
+        account = self._resolve_account(account)
         options = account["options"]
 
         if not isinstance(witnesses, (list, set)):
-            witnesses = set(witnesses)
+            witnesses = [witnesses]
 
-        for witness in witnesses:
-            witness = Witness(witness, muse_instance=self)
-            options["votes"].append(witness["vote_id"])
+        vote_set = set(options["votes"])
+        for witness in self._resolve_witnesses(witnesses):
+            vote_set.add(witness["vote_id"])
 
-        options["votes"] = list(set(options["votes"]))
-        options["num_witness"] = len(list(filter(
-            lambda x: float(x.split(":")[0]) == 1,
-            options["votes"]
-        )))
+        options["votes"] = sorted(vote_set, key=_vote_sort_key)
+        options["num_witness"] = sum(
+            map(_is_witness_vote, options["votes"]))
 
         op = operations.Account_update(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account": account["id"],
             "new_options": options,
             "extensions": {},
-            "prefix": self.rpc.chain_params["prefix"]
         })
+        self.invalidate_account(account["name"])
         return self.finalizeOp(op, account["name"], "active")
 
     def disapprovewitness(self, witnesses, account=None):
@@ -647,35 +921,27 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account, muse_instance=self)
+        account = self._resolve_account(account)
         options = account["options"]
 
         if not isinstance(witnesses, (list, set)):
-            witnesses = set(witnesses)
+            witnesses = [witnesses]
 
-        for witness in witnesses:
-            witness = Witness(witness, muse_instance=self)
-            if witness["vote_id"] in options["votes"]:
-                options["votes"].remove(witness["vote_id"])
+        vote_set = set(options["votes"])
+        for witness in self._resolve_witnesses(witnesses):
+            vote_set.discard(witness["vote_id"])
 
-        options["votes"] = list(set(options["votes"]))
-        options["num_witness"] = len(list(filter(
-            lambda x: float(x.split(":")[0]) == 1,
-            options["votes"]
-        )))
+        options["votes"] = sorted(vote_set, key=_vote_sort_key)
+        options["num_witness"] = sum(
+            map(_is_witness_vote, options["votes"]))
 
         op = operations.Account_update(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account": account["id"],
             "new_options": options,
             "extensions": {},
-            "prefix": self.rpc.chain_params["prefix"]
         })
+        self.invalidate_account(account["name"])
         return self.finalizeOp(op, account["name"], "active")
 
     def approvecommittee(self, committees, account=None):
@@ -685,34 +951,27 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account, muse_instance=self)
+        account = self._resolve_account(account)
         options = account["options"]
 
         if not isinstance(committees, (list, set)):
-            committees = set(committees)
+            committees = [committees]
 
-        for committee in committees:
-            committee = Committee(committee, muse_instance=self)
-            options["votes"].append(committee["vote_id"])
+        vote_set = set(options["votes"])
+        for committee in self._resolve_committee_members(committees):
+            vote_set.add(committee["vote_id"])
 
-        options["votes"] = list(set(options["votes"]))
-        options["num_committee"] = len(list(filter(
-            lambda x: float(x.split(":")[0]) == 0,
-            options["votes"]
-        )))
+        options["votes"] = sorted(vote_set, key=_vote_sort_key)
+        options["num_committee"] = sum(
+            map(_is_committee_vote, options["votes"]))
 
         op = operations.Account_update(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account": account["id"],
             "new_options": options,
             "extensions": {},
-            "prefix": self.rpc.chain_params["prefix"]
         })
+        self.invalidate_account(account["name"])
         return self.finalizeOp(op, account["name"], "active")
 
     def disapprovecommittee(self, committees, account=None):
@@ -722,35 +981,27 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account, muse_instance=self)
+        account = self._resolve_account(account)
         options = account["options"]
 
         if not isinstance(committees, (list, set)):
-            committees = set(committees)
+            committees = [committees]
 
-        for committee in committees:
-            committee = Committee(committee, muse_instance=self)
-            if committee["vote_id"] in options["votes"]:
-                options["votes"].remove(committee["vote_id"])
+        vote_set = set(options["votes"])
+        for committee in self._resolve_committee_members(committees):
+            vote_set.discard(committee["vote_id"])
 
-        options["votes"] = list(set(options["votes"]))
-        options["num_committee"] = len(list(filter(
-            lambda x: float(x.split(":")[0]) == 0,
-            options["votes"]
-        )))
+        options["votes"] = sorted(vote_set, key=_vote_sort_key)
+        options["num_committee"] = sum(
+            map(_is_committee_vote, options["votes"]))
 
         op = operations.Account_update(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account": account["id"],
             "new_options": options,
             "extensions": {},
-            "prefix": self.rpc.chain_params["prefix"]
         })
+        self.invalidate_account(account["name"])
         return self.finalizeOp(op, account["name"], "active")
 
     def cancel(self, orderNumber, account=None):
@@ -760,22 +1011,18 @@ class Muse(object):
 
             :param str orderNumber: The Order Object ide of the form ``1.7.xxxx``
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
+        account = self._resolve_accountname(account)
         account = Account(account, full=False, muse_instance=self)
 
-        op = []
-        for order in list(orderNumber):
-            op.append(
-                operations.Limit_order_cancel(**{
-                    "fee": {"amount": 0, "asset_id": "1.3.0"},
-                    "fee_paying_account": account["id"],
-                    "order": order,
-                    "extensions": [],
-                    "prefix": self.rpc.chain_params["prefix"]}))
+        account_id = account["id"]
+        op = [
+            operations.Limit_order_cancel(**{
+                **self._op_base,
+                "fee_paying_account": account_id,
+                "order": order,
+                "extensions": []})
+            for order in orderNumber
+        ]
         return self.finalizeOp(op, account["name"], "active")
 
     def approveproposal(self, proposal_ids, account=None, approver=None):
@@ -785,31 +1032,36 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        from .proposal import Proposal
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
         if not approver:
             approver = account
         else:
-            approver = Account(approver)
-
-        if not isinstance(proposal_ids, (list, set)):
-            proposal_ids = set(proposal_ids)
-
-        op = []
-        for proposal_id in proposal_ids:
-            proposal = Proposal(proposal_id, muse_instance=self)
-            op.append(operations.Proposal_update(**{
-                "fee": {"amount": 0, "asset_id": "1.3.0"},
-                'fee_paying_account': account["id"],
-                'proposal': proposal["id"],
-                'active_approvals_to_add': [approver["id"]],
-                "prefix": self.rpc.chain_params["prefix"]
-            }))
+            approver = self._get_account(approver)
+
+        if isinstance(proposal_ids, str):
+            proposal_ids = [proposal_ids]
+        # Deduplicate while keeping the caller's order; the previous
+        # isinstance guard let duplicates in lists through (and would
+        # have iterated the characters of a single id string)
+        proposal_ids = list(dict.fromkeys(proposal_ids))
+
+        # Validate all proposals with a single multi-id lookup; the op
+        # itself only needs the (already known) id
+        for proposal in self.rpc.get_objects(proposal_ids):
+            if not proposal:
+                raise ProposalDoesNotExistException
+
+        account_id = account["id"]
+        approver_id = approver["id"]
+        op = [
+            operations.Proposal_update(**{
+                **self._op_base,
+                'fee_paying_account': account_id,
+                'proposal': proposal_id,
+                'active_approvals_to_add': [approver_id],
+            })
+            for proposal_id in proposal_ids
+        ]
         return self.finalizeOp(op, account["name"], "active")
 
     def disapproveproposal(self, proposal_ids, account=None, approver=None):
@@ -819,31 +1071,36 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        from .proposal import Proposal
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
         if not approver:
             approver = account
         else:
-            approver = Account(approver)
-
-        if not isinstance(proposal_ids, (list, set)):
-            proposal_ids = set(proposal_ids)
-
-        op = []
-        for proposal_id in proposal_ids:
-            proposal = Proposal(proposal_id, muse_instance=self)
-            op.append(operations.Proposal_update(**{
-                "fee": {"amount": 0, "asset_id": "1.3.0"},
-                'fee_paying_account': account["id"],
-                'proposal': proposal["id"],
-                'active_approvals_to_remove': [approver["id"]],
-                "prefix": self.rpc.chain_params["prefix"]
-            }))
+            approver = self._get_account(approver)
+
+        if isinstance(proposal_ids, str):
+            proposal_ids = [proposal_ids]
+        # Deduplicate while keeping the caller's order; the previous
+        # isinstance guard let duplicates in lists through (and would
+        # have iterated the characters of a single id string)
+        proposal_ids = list(dict.fromkeys(proposal_ids))
+
+        # Validate all proposals with a single multi-id lookup; the op
+        # itself only needs the (already known) id
+        for proposal in self.rpc.get_objects(proposal_ids):
+            if not proposal:
+                raise ProposalDoesNotExistException
+
+        account_id = account["id"]
+        approver_id = approver["id"]
+        op = [
+            operations.Proposal_update(**{
+                **self._op_base,
+                'fee_paying_account': account_id,
+                'proposal': proposal_id,
+                'active_approvals_to_remove': [approver_id],
+            })
+            for proposal_id in proposal_ids
+        ]
         return self.finalizeOp(op, account["name"], "active")
 
     def upgrade_account(self, account=None):
@@ -852,17 +1109,11 @@ class Muse(object):
             :param str account: (optional) the account to allow access
                 to (defaults to ``default_account``)
         """
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
         op = operations.Account_upgrade(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "account_to_upgrade": account["id"],
             "upgrade_to_lifetime_member": True,
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
 
@@ -875,16 +1126,10 @@ class Muse(object):
         """
         assert self.proposer, "'sport_create' needs to be proposed"
         assert isinstance(names, list)
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
         op = operations.Sport_create(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "name": names,
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
 
@@ -898,17 +1143,11 @@ class Muse(object):
         """
         assert self.proposer, "'competitor_create' needs to be proposed"
         assert isinstance(names, list)
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
         op = operations.Competitor_create(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "name": names,
             "sport_id": sport_id,
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
 
@@ -922,17 +1161,11 @@ class Muse(object):
         """
         assert self.proposer, "'event_group_create' needs to be proposed"
         assert isinstance(names, list)
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
         op = operations.Event_group_create(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "name": names,
             "sport_id": sport_id,
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
 
@@ -957,19 +1190,13 @@ class Muse(object):
         assert isinstance(season, list)
         assert isinstance(competitors, list)
         assert isinstance(start_time, datetime), "start_time needs to be a `datetime.datetime`"
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
         op = operations.Event_create(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "season": season,
             "start_time": formatTime(start_time),
             "event_group_id": event_group_id,
             "competitors": competitors,
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
 
@@ -985,12 +1212,7 @@ class Muse(object):
         """
         assert self.proposer, "'betting_market_create' needs to be proposed"
         assert type in ["moneyline", "spread", "overunder"], "invalid type"
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
 
         if type == "moneyline":
             options = [0, {}]
@@ -1000,10 +1222,9 @@ class Muse(object):
             options = [2, {"score": score}]
 
         op = operations.Betting_market_group_create(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "event_id": event_id,
             "options": options,
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
 
@@ -1024,19 +1245,13 @@ class Muse(object):
         """
         assert self.proposer, "'betting_market_create' needs to be proposed"
         assert isinstance(payout_condition, list)
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
-        asset = Asset(asset)
+        account = self._resolve_account(account)
+        asset = Asset(asset, muse_instance=self)
         op = operations.Betting_market_create(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "group_id": group_id,
             "payout_condition": payout_condition,
             "asset_id": asset["id"],
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
 
@@ -1050,17 +1265,11 @@ class Muse(object):
         """
         assert self.proposer, "'betting_market_create' needs to be proposed"
         assert result in ["win", "not_win", "cancel"], "invalid result"
-        if not account:
-            if "default_account" in config:
-                account = config["default_account"]
-        if not account:
-            raise ValueError("You need to provide an account")
-        account = Account(account)
+        account = self._resolve_account(account)
 
         op = operations.Betting_market_resolve(**{
-            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            **self._op_base,
             "betting_market_id": market_id,
             "resolution": result,
-            "prefix": self.rpc.chain_params["prefix"]
         })
         return self.finalizeOp(op, account["name"], "active")
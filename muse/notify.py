@@ -1,8 +1,12 @@
 import logging
+import queue
+import threading
+
 from events import Events
 from museapi.websocket import MuseWebsocket
 from muse.instance import shared_muse_instance
 from muse.account import Account, AccountUpdate
+from muse.exceptions import AccountDoesNotExistsException
 log = logging.getLogger(__name__)
 # logging.basicConfig(level=logging.DEBUG)
 
@@ -59,14 +63,32 @@ class Notify(Events):
         # muse instance
         self.muse = muse_instance or shared_muse_instance()
 
-        # Accounts
+        # Accounts: resolve the whole watchlist with one batched
+        # round-trip instead of a blocking Account() call per entry
         account_ids = []
-        for account_name in accounts:
-            account = Account(
-                account_name,
-                muse_instance=self.muse
-            )
-            account_ids.append(account["id"])
+        if accounts:
+            batch = self.muse.rpc.batch()
+            for account_name in accounts:
+                if len(account_name.split(".")) == 3:
+                    batch.get_objects([account_name])
+                else:
+                    batch.get_account_by_name(account_name)
+            for account_name, account in zip(accounts, batch.execute()):
+                if isinstance(account, list):
+                    account = account[0] if account else None
+                if not account:
+                    raise AccountDoesNotExistsException(account_name)
+                account_ids.append(account["id"])
+
+        # Dispatch worker: the websocket receiver thread only
+        # enqueues account updates, so a slow user callback (database
+        # writes, logging, ...) cannot back-pressure the connection
+        self._queue = queue.Queue()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop,
+            daemon=True,
+        )
+        self._dispatcher.start()
 
         # Callbacks
         if on_tx:
@@ -94,8 +116,22 @@ class Notify(Events):
     def process_account(self, message):
         """ This is used for processing of account Updates. It will
             return instances of :class:muse.account.AccountUpdate`
+            through ``on_account``, dispatched from a worker thread
+        """
+        self._queue.put(message)
+
+    def _dispatch_loop(self):
+        """ Deliver queued account updates to the registered
+            callbacks, decoupled from the websocket receiver
         """
-        self.on_account(AccountUpdate(message))
+        while True:
+            message = self._queue.get()
+            try:
+                self.on_account(AccountUpdate(message))
+            except Exception:
+                log.exception("Error in on_account callback")
+            finally:
+                self._queue.task_done()
 
     def listen(self):
         """ This call initiates the listening/notification process. It
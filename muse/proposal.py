@@ -12,6 +12,12 @@ class Proposal(dict):
         :param muse muse_instance: muse() instance to use when accesing a RPC
 
     """
+
+    # The payload lives in the dict base; slotting the two bookkeeping
+    # attributes drops the per-instance __dict__, which adds up when
+    # Proposals materializes many pending proposals
+    __slots__ = ("id", "muse")
+
     def __init__(
         self,
         id,
@@ -22,11 +28,22 @@ class Proposal(dict):
         self.muse = muse_instance or shared_muse_instance()
         self.refresh()
 
+    @classmethod
+    def _from_data(cls, id, data, muse_instance=None):
+        """ Instantiate a proposal from an already fetched object
+            without the refresh() round-trip
+        """
+        proposal = cls.__new__(cls)
+        proposal.id = id
+        proposal.muse = muse_instance or shared_muse_instance()
+        dict.__init__(proposal, data)
+        return proposal
+
     def refresh(self):
         a, b, c = self.id.split(".")
         assert int(a) == 1 and int(b) == 10, "Valid proposal ids are 1.10.x"
         proposal = self.muse.rpc.get_objects([self.id])
-        if not any(proposal):
+        if not proposal or proposal[0] is None:
             raise ProposalDoesNotExistException
         super(Proposal, self).__init__(proposal[0])
 
@@ -43,9 +60,13 @@ class Proposals(list):
         account = Account(account)
         proposals = self.muse.rpc.get_proposed_transactions(account["id"])
 
+        # get_proposed_transactions already returns the full proposal
+        # objects; hydrate the Proposal instances from them directly
+        # instead of one get_objects round-trip per proposal
         super(Proposals, self).__init__(
             [
-                Proposal(x, muse_instance=self.muse)
+                Proposal._from_data(
+                    x["id"], x, muse_instance=self.muse)
                 for x in proposals
             ]
         )
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class MuseAsyncRPC(object):
+    """ Concurrent RPC calls over a single websocket connection.
+
+        :param str url: Websocket URL of the API node
+        :param int max_tasks: Maximum number of calls that are in
+            flight at the same time (defaults to 10)
+
+        Contrary to :class:`museapi.node.MuseNodeRPC`, which blocks for
+        one round-trip per call, this class fires many calls at once
+        and matches the replies back by their ``id``, so N lookups cost
+        roughly a single round-trip:
+
+        .. code-block:: python
+
+            rpc = MuseAsyncRPC("wss://node")
+            loop = asyncio.get_event_loop()
+            objs = loop.run_until_complete(
+                rpc.get_objects_async(["1.18.0", "1.18.1"]))
+
+    """
+    def __init__(self, url, max_tasks=10):
+        self.url = url
+        self.max_tasks = max_tasks
+
+    async def rpcexec_many(self, calls):
+        """ Execute many calls concurrently on a single websocket
+
+            :param list calls: list of ``(method, params)`` tuples
+            :returns: results in the order the calls were given
+        """
+        results = [None] * len(calls)
+        if not calls:
+            return results
+        semaphore = asyncio.Semaphore(self.max_tasks)
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.url) as ws:
+
+                async def send(i, method, params):
+                    async with semaphore:
+                        await ws.send_json({
+                            "method": "call",
+                            "params": [0, method, list(params)],
+                            "jsonrpc": "2.0",
+                            "id": i
+                        })
+
+                await asyncio.gather(*[
+                    send(i, method, params)
+                    for i, (method, params) in enumerate(calls)
+                ])
+
+                loads = orjson.loads if orjson is not None \
+                    else json.loads
+                received = 0
+                while received < len(calls):
+                    reply = loads(await ws.receive_str())
+                    if "id" not in reply:
+                        # Notification/subscription noise, not ours
+                        continue
+                    results[reply["id"]] = reply.get("result")
+                    received += 1
+        return results
+
+    async def get_objects_async(self, ids):
+        """ Fetch many objects concurrently
+
+            :param list ids: Object ids to fetch
+        """
+        results = await self.rpcexec_many([
+            ("get_objects", [[i]]) for i in ids
+        ])
+        return [r[0] if r else None for r in results]
+
+
+def get_objects(url, ids, max_tasks=10):
+    """ Synchronous convenience wrapper around
+        :func:`MuseAsyncRPC.get_objects_async`
+
+        :param str url: Websocket URL of the API node
+        :param list ids: Object ids to fetch
+    """
+    rpc = MuseAsyncRPC(url, max_tasks=max_tasks)
+    return asyncio.run(rpc.get_objects_async(ids))
+
+
+def call_many(url, calls, max_tasks=10):
+    """ Synchronous convenience wrapper around
+        :func:`MuseAsyncRPC.rpcexec_many`
+
+        :param str url: Websocket URL of the API node
+        :param list calls: list of ``(method, params)`` tuples
+    """
+    rpc = MuseAsyncRPC(url, max_tasks=max_tasks)
+    return asyncio.run(rpc.rpcexec_many(calls))
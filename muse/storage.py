@@ -210,6 +210,85 @@ class Key(DataDir):
         connection.commit()
 
 
+class ObjectCache(DataDir):
+    """ This is an on-disk cache for immutable chain objects (e.g.
+        blocks) stored in the `objectcache` table of the SQLite3
+        database. Entries are keyed by API node, object kind and id so
+        that repeated CLI invocations can be served without hitting the
+        network.
+    """
+    __tablename__ = 'objectcache'
+
+    def __init__(self):
+        super(ObjectCache, self).__init__()
+
+    def exists_table(self):
+        """ Check if the database table exists
+        """
+        query = ("SELECT name FROM sqlite_master " +
+                 "WHERE type='table' AND name=?",
+                 (self.__tablename__, ))
+        connection = sqlite3.connect(self.sqlDataBaseFile)
+        cursor = connection.cursor()
+        cursor.execute(*query)
+        return True if cursor.fetchone() else False
+
+    def create_table(self):
+        """ Create the new table in the SQLite database
+        """
+        query = ('CREATE TABLE %s (' % self.__tablename__ +
+                 'id INTEGER PRIMARY KEY AUTOINCREMENT,' +
+                 'url STRING(256),' +
+                 'kind STRING(32),' +
+                 'objectid STRING(256),' +
+                 'value TEXT' +
+                 ')')
+        connection = sqlite3.connect(self.sqlDataBaseFile)
+        cursor = connection.cursor()
+        # WAL allows several CLI processes to read/write concurrently
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(query)
+        connection.commit()
+
+    def get(self, url, kind, objectid):
+        """ Return the cached json string for an object or ``None``
+
+           :param str url: API node the object was fetched from
+           :param str kind: Kind of object (e.g. ``block``)
+           :param str objectid: Id of the object
+        """
+        query = ("SELECT value FROM %s " % (self.__tablename__) +
+                 "WHERE url=? AND kind=? AND objectid=?",
+                 (url, kind, objectid))
+        connection = sqlite3.connect(self.sqlDataBaseFile)
+        cursor = connection.cursor()
+        cursor.execute(*query)
+        result = cursor.fetchone()
+        if result:
+            return result[0]
+        else:
+            return None
+
+    def add(self, url, kind, objectid, value):
+        """ Store the json string for an object
+
+           :param str url: API node the object was fetched from
+           :param str kind: Kind of object (e.g. ``block``)
+           :param str objectid: Id of the object
+           :param str value: json serialization of the object
+        """
+        if self.get(url, kind, objectid):
+            return
+        query = ('INSERT INTO %s (url, kind, objectid, value) ' %
+                 self.__tablename__ +
+                 'VALUES (?, ?, ?, ?)',
+                 (url, kind, objectid, value))
+        connection = sqlite3.connect(self.sqlDataBaseFile)
+        cursor = connection.cursor()
+        cursor.execute(*query)
+        connection.commit()
+
+
 class Configuration(DataDir):
     """ This is the configuration storage that stores key/value
         pairs in the `config` table of the SQLite3 database.
@@ -448,11 +527,15 @@ class MasterPassword(object):
 # Create keyStorage
 keyStorage = Key()
 configStorage = Configuration()
+cacheStorage = ObjectCache()
 
 # Create Tables if database is brand new
 if not configStorage.exists_table():
     configStorage.create_table()
 
+if not cacheStorage.exists_table():
+    cacheStorage.create_table()
+
 newKeyStorage = False
 if not keyStorage.exists_table():
     newKeyStorage = True
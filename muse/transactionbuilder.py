@@ -20,11 +20,28 @@ class TransactionBuilder(dict):
 
     def __init__(self, tx={}, muse_instance=None):
         self.muse = muse_instance or shared_muse_instance()
+        self._wif_cache = {}
+        self._account_cache = {}
         self.clear()
         if not isinstance(tx, dict):
             raise ValueError("Invalid TransactionBuilder Format")
         super(TransactionBuilder, self).__init__(tx)
 
+    def _get_account(self, account):
+        """ Resolve an account by name or id, memoized on the builder
+            so authority graphs that revisit the same account (e.g.
+            diamond multisig structures) fetch it only once
+        """
+        if isinstance(account, Account):
+            # Already resolved (dicts are unhashable, so it cannot be
+            # used as the cache key itself); warm the cache by name
+            self._account_cache[account["name"]] = account
+            return account
+        if account not in self._account_cache:
+            self._account_cache[account] = Account(
+                account, muse_instance=self.muse)
+        return self._account_cache[account]
+
     def appendOps(self, ops):
         """ Append op(s) to the transaction builder
 
@@ -34,33 +51,51 @@ class TransactionBuilder(dict):
             self.ops.extend(ops)
         else:
             self.ops.append(ops)
+        self._built_ops = None
 
     def appendSigner(self, account, permission):
         """ Try to obtain the wif key from the wallet by telling which account
             and permission is supposed to sign the transaction
+
+            The resolved keys are cached per (account, permission), so
+            appending the same signer for every operation of a bundle
+            costs the wallet/account recursion only once.
         """
         assert permission in ["active", "owner"], "Invalid permission"
-        account = Account(account, muse_instance=self.muse)
+        cache_key = (str(account), permission)
+        if cache_key in self._wif_cache:
+            self.wifs.extend([
+                x for x in self._wif_cache[cache_key]
+                if x not in self.wifs
+            ])
+            return
+        account = self._get_account(account)
         required_treshold = account[permission]["weight_threshold"]
 
         def fetchkeys(account, level=0):
             if level > 2:
                 return []
             r = []
+            weight = 0
             for authority in account[permission]["key_auths"]:
                 wif = self.muse.wallet.getPrivateKeyForPublicKey(authority[0])
                 if wif:
                     r.append([wif, authority[1]])
+                    weight += authority[1]
 
-            if sum([x[1] for x in r]) < required_treshold:
+            if weight < required_treshold:
                 # go one level deeper
                 for authority in account[permission]["account_auths"]:
-                    auth_account = Account(authority[0], muse_instance=self.muse)
+                    auth_account = self._get_account(authority[0])
                     r.extend(fetchkeys(auth_account, level + 1))
 
             return r
         keys = fetchkeys(account)
-        self.wifs.extend([x[0] for x in keys])
+        self._wif_cache[cache_key] = [x[0] for x in keys]
+        self.wifs.extend([
+            x for x in self._wif_cache[cache_key]
+            if x not in self.wifs
+        ])
 
     def appendWif(self, wif):
         """ Add a wif that should be used for signing of the transaction.
@@ -76,12 +111,15 @@ class TransactionBuilder(dict):
         """ Construct the actual transaction and store it in the class's dict
             store
         """
-        if self.muse.proposer:
-            ops = [operations.Op_wrapper(op=o) for o in list(self.ops)]
-            proposer = Account(
-                self.muse.proposer,
-                muse_instance=self.muse
-            )
+        # Rewrapping the ops is pure CPU work that yields the same
+        # result until appendOps changes the buffer; reuse the wrapped
+        # list on repeated sign()/addSigningInformation() cycles
+        if self._built_ops is not None:
+            ops = self._built_ops
+        elif self.muse.proposer:
+            ops = [operations.Op_wrapper(op=o) for o in self.ops]
+            proposer = self._get_account(self.muse.proposer)
+            self._proposer_account = proposer
             ops = operations.Proposal_create(**{
                 "fee": {"amount": 0, "asset_id": "1.3.0"},
                 "fee_paying_account": proposer["id"],
@@ -91,18 +129,32 @@ class TransactionBuilder(dict):
                 "extensions": []
             })
             ops = [Operation(ops)]
+            self._built_ops = ops
         else:
-            ops = [Operation(o) for o in list(self.ops)]
-
-        ops = transactions.addRequiredFees(self.muse.rpc, ops)
+            ops = [Operation(o) for o in self.ops]
+            self._built_ops = ops
+
+        # Obtain the required fees and the head block parameters with a
+        # single pipelined batch request instead of two sequential
+        # round-trips
+        batch = self.muse.rpc.batch()
+        batch.get_required_fees([o.json() for o in ops], "1.3.0")
+        batch.get_dynamic_global_properties()
+        fees, props = batch.execute()
+
+        ops = transactions.applyRequiredFees(ops, fees)
         expiration = transactions.formatTimeFromNow(self.muse.expiration)
-        ref_block_num, ref_block_prefix = transactions.getBlockParams(self.muse.rpc)
+        ref_block_num, ref_block_prefix = \
+            transactions.getBlockParamsFromProperties(props)
         tx = Signed_Transaction(
             ref_block_num=ref_block_num,
             ref_block_prefix=ref_block_prefix,
             expiration=expiration,
             operations=ops
         )
+        # Keep the constructed object so sign() doesn't have to
+        # rebuild it from its own serialization
+        self._signed_tx = tx
         super(TransactionBuilder, self).__init__(tx.json())
 
     def sign(self):
@@ -114,29 +166,36 @@ class TransactionBuilder(dict):
                 from the wallet as defined in "missing_signatures" key
                 of the transactions.
         """
-        self.constructTx()
+        if self.ops:
+            self.constructTx()
 
-        # If we are doing a proposal, obtain the account from the proposer_id
+        # If we are doing a proposal, the proposer signs; reuse the
+        # account that constructTx already resolved
         if self.muse.proposer:
-            proposer = Account(
-                self.muse.proposer,
-                muse_instance=self.muse)
+            proposer = (self._proposer_account or
+                        self._get_account(self.muse.proposer))
             self.wifs = []
             self.appendSigner(proposer["id"], "active")
 
         # We need to set the default prefix, otherwise pubkeys are
         # presented wrongly!
         if self.muse.rpc:
-            operations.default_prefix = self.muse.rpc.chain_params["prefix"]
+            operations.default_prefix = self.muse._prefix
         elif "blockchain" in self:
             operations.default_prefix = self["blockchain"]["prefix"]
 
-        try:
-            signedtx = Signed_Transaction(**self.json())
-        except:
-            raise ValueError("Invalid TransactionBuilder Format")
+        if self._signed_tx is not None:
+            # Reuse the transaction constructed by constructTx()
+            # instead of deserializing it back out of our dict store
+            signedtx = self._signed_tx
+        else:
+            # Externally supplied transaction (e.g. offline signer)
+            try:
+                signedtx = Signed_Transaction(**self.json())
+            except:
+                raise ValueError("Invalid TransactionBuilder Format")
 
-        if not any(self.wifs):
+        if not self.wifs:
             raise MissingKeyError
 
         signedtx.sign(self.wifs, chain=self.muse.rpc.chain_params)
@@ -156,7 +215,13 @@ class TransactionBuilder(dict):
 
             :param tx tx: Signed transaction to broadcast
         """
-        self.sign()
+        if self.get("signatures") and not self.wifs:
+            # Already signed (e.g. offline signer or a retried
+            # broadcast): resubmit as-is instead of redoing the ECDSA
+            # work, which dominates the cost of this module
+            pass
+        else:
+            self.sign()
 
         if self.muse.nobroadcast:
             log.warning("Not broadcasting anything!")
@@ -168,15 +233,28 @@ class TransactionBuilder(dict):
         except Exception as e:
             raise e
 
-        self.clear()
+        self.reset_ops_keep_context()
 
         return self
 
     def clear(self):
         """ Clear the transaction builder and start from scratch
         """
+        self._wif_cache.clear()
+        self._account_cache.clear()
+        self.reset_ops_keep_context()
+
+    def reset_ops_keep_context(self):
+        """ Drop the operations and signatures of the previous
+            transaction but keep the cached signing-key lookups, so
+            that consecutive transactions for the same signer do not
+            redo the wallet and account-authority recursion
+        """
         self.ops = []
         self.wifs = []
+        self._signed_tx = None
+        self._built_ops = None
+        self._proposer_account = None
         super(TransactionBuilder, self).__init__({})
 
     def addSigningInformation(self, account, permission):
@@ -185,7 +263,7 @@ class TransactionBuilder(dict):
             signing (e.g. for multisig or coldstorage)
         """
         self.constructTx()
-        accountObj = Account(account)
+        accountObj = self._get_account(account)
         authority = accountObj[permission]
         # We add a required_authorities to be able to identify
         # how to sign later. This is an array, because we
@@ -193,22 +271,25 @@ class TransactionBuilder(dict):
         self.update({"required_authorities": {
             accountObj["name"]: authority
         }})
-        for account_auth in authority["account_auths"]:
-            account_auth_account = Account(account_auth[0])
-            self["required_authorities"].update({
-                account_auth[0]: account_auth_account.get(permission)
-            })
-
         # Try to resolve required signatures for offline signing
         self["missing_signatures"] = [
             x[0] for x in authority["key_auths"]
         ]
-        # Add one recursion of keys from account_auths:
-        for account_auth in authority["account_auths"]:
-            account_auth_account = Account(account_auth[0])
-            self["missing_signatures"].extend(
-                [x[0] for x in account_auth_account[permission]["key_auths"]]
-            )
+        # Resolve all account_auths with one multi-id lookup (instead
+        # of two Account() round-trips per entry) and drive both the
+        # required_authorities and one recursion of missing keys from
+        # the results
+        auth_ids = [x[0] for x in authority["account_auths"]]
+        if auth_ids:
+            for data in self.muse.rpc.get_objects(auth_ids):
+                if not data:
+                    continue
+                self["required_authorities"].update({
+                    data["id"]: data.get(permission)
+                })
+                self["missing_signatures"].extend(
+                    [x[0] for x in data[permission]["key_auths"]]
+                )
         self["blockchain"] = self.muse.rpc.chain_params
 
     def json(self):
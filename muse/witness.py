@@ -1,5 +1,6 @@
 from muse.instance import shared_muse_instance
 from .account import Account
+from .cache import TTLCache
 from .exceptions import WitnessDoesNotExistsException
 
 
@@ -11,7 +12,7 @@ class Witness(dict):
 
     """
 
-    witness_cache = dict()
+    witness_cache = TTLCache(maxsize=8192, ttl=60)
 
     def __init__(
         self,
@@ -36,8 +37,12 @@ class Witness(dict):
                 self.refresh()
 
     def _cache(self, witness):
-        # store in cache
+        # store in cache, both under the id and under the key that was
+        # used for the lookup (account name or id), so approve loops
+        # resolving by name hit the cache as well
         Witness.witness_cache[witness["id"]] = witness
+        if self.witness != witness["id"]:
+            Witness.witness_cache[self.witness] = witness
 
     def refresh(self):
         parts = self.witness.split(".")
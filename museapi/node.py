@@ -1,11 +1,81 @@
 import re
+import json
 from grapheneapi.graphenewsrpc import GrapheneWebsocketRPC
+
+try:
+    # C-implemented parser; batched replies easily reach tens of
+    # kilobytes and the stdlib parser shows up in profiles there
+    import orjson
+except ImportError:
+    orjson = None
 from musebase.chains import known_chains
 from . import exceptions
 import logging
 log = logging.getLogger(__name__)
 
 
+class RPCBatch(object):
+    """ Accumulate RPC calls and send them to the node as a single
+        JSON-RPC 2.0 batch request.
+
+        Instead of paying one websocket round-trip per call, all
+        accumulated calls are serialized into one JSON array, sent
+        at once, and matched back by their ``id``:
+
+        .. code-block:: python
+
+            batch = rpc.batch()
+            batch.get_block(1)
+            batch.get_objects(["2.0.0"])
+            block, objs = batch.execute()
+
+    """
+    def __init__(self, rpc):
+        self.rpc = rpc
+        self.calls = []
+
+    def __getattr__(self, name):
+        """ Map all methods to RPC calls and accumulate them instead
+            of executing them right away. Returns the position of the
+            call within the batch.
+        """
+        def method(*args, api_id=0):
+            self.calls.append({
+                "method": "call",
+                "params": [api_id, name, list(args)],
+                "jsonrpc": "2.0",
+                "id": len(self.calls)
+            })
+            return len(self.calls) - 1
+        return method
+
+    def execute(self):
+        """ Send the accumulated calls as one batch request and return
+            the results in the order the calls have been added
+        """
+        if not self.calls:
+            return []
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(json.dumps(self.calls))
+        if orjson is not None:
+            self.rpc.ws.send(orjson.dumps(self.calls))
+            ret = orjson.loads(self.rpc.ws.recv())
+        else:
+            self.rpc.ws.send(
+                json.dumps(self.calls, ensure_ascii=False).encode('utf8'))
+            ret = json.loads(self.rpc.ws.recv(), strict=False)
+        results = [None] * len(self.calls)
+        for reply in ret:
+            if 'error' in reply:
+                if 'detail' in reply['error']:
+                    raise exceptions.RPCError(reply['error']['detail'])
+                else:
+                    raise exceptions.RPCError(reply['error']['message'])
+            results[reply["id"]] = reply.get("result")
+        self.calls = []
+        return results
+
+
 class MuseNodeRPC(GrapheneWebsocketRPC):
 
     def __init__(self, *args, **kwargs):
@@ -46,6 +116,12 @@ class MuseNodeRPC(GrapheneWebsocketRPC):
         except Exception as e:
             raise e
 
+    def batch(self):
+        """ Return a :class:`RPCBatch` that accumulates RPC calls and
+            sends them as a single JSON-RPC batch request
+        """
+        return RPCBatch(self)
+
     def get_account(self, name, **kwargs):
         """ Get full account details from account name or id
 
@@ -17,6 +17,18 @@ class PasswordKey(GPHPasswordKey):
     def __init__(self, *args, **kwargs):
         super(PasswordKey, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def derive_all(cls, account, password,
+                   roles=("active", "owner", "memo")):
+        """ Derive the password keys for several roles in one call
+
+            :param str account: Account name
+            :param str password: Passphrase
+            :param tuple roles: Roles to derive a key for
+            :returns: one ``PasswordKey`` per role, in the given order
+        """
+        return [cls(account, password, role=role) for role in roles]
+
 
 class BrainKey(GPHBrainKey):
     """Brainkey implementation similar to the graphene-ui web-wallet.
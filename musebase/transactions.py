@@ -1,29 +1,49 @@
+import struct
+from binascii import unhexlify
+
 from .signedtransactions import Signed_Transaction
 from .objects import Asset
 from graphenebase.transactions import getBlockParams, formatTimeFromNow
 
 
-def addRequiredFees(ws, ops, asset_id="1.3.0"):
-    """ Auxiliary method to obtain the required fees for a set of
-        operations. Requires a websocket connection to a witness node!
+def applyRequiredFees(ops, fees):
+    """ Auxiliary method to apply fees (as obtained from
+        ``get_required_fees``) to a set of operations
     """
-    fees = ws.get_required_fees([i.json() for i in ops], asset_id)
-    for i, d in enumerate(ops):
-        if isinstance(fees[i], list):
+    for op, fee in zip(ops, fees):
+        data = op.op.data
+        if isinstance(fee, list):
             # Operation is a proposal
-            ops[i].op.data["fee"] = Asset(
-                amount=fees[i][0]["amount"],
-                asset_id=fees[i][0]["asset_id"]
+            data["fee"] = Asset(
+                amount=fee[0]["amount"],
+                asset_id=fee[0]["asset_id"]
             )
-            for j, _ in enumerate(ops[i].op.data["proposed_ops"].data):
-                ops[i].op.data["proposed_ops"].data[j].data["op"].op.data["fee"] = (
-                    Asset(
-                        amount=fees[i][1][j]["amount"],
-                        asset_id=fees[i][1][j]["asset_id"]))
+            for proposed, sub_fee in zip(data["proposed_ops"].data, fee[1]):
+                proposed.data["op"].op.data["fee"] = Asset(
+                    amount=sub_fee["amount"],
+                    asset_id=sub_fee["asset_id"])
         else:
             # Operation is a regular operation
-            ops[i].op.data["fee"] = Asset(
-                amount=fees[i]["amount"],
-                asset_id=fees[i]["asset_id"]
+            data["fee"] = Asset(
+                amount=fee["amount"],
+                asset_id=fee["asset_id"]
             )
     return ops
+
+
+def addRequiredFees(ws, ops, asset_id="1.3.0"):
+    """ Auxiliary method to obtain the required fees for a set of
+        operations. Requires a websocket connection to a witness node!
+    """
+    fees = ws.get_required_fees([i.json() for i in ops], asset_id)
+    return applyRequiredFees(ops, fees)
+
+
+def getBlockParamsFromProperties(props):
+    """ Auxiliary method to derive the reference block parameters from
+        dynamic global properties that have already been fetched
+    """
+    ref_block_num = props["head_block_number"] & 0xFFFF
+    ref_block_prefix = struct.unpack_from(
+        "<I", unhexlify(props["head_block_id"]), 4)[0]
+    return ref_block_num, ref_block_prefix
@@ -49,6 +49,7 @@ setup(
         "scrypt",
         "appdirs",
         "pycrypto",
+        "aiohttp",
     ],
     setup_requires=['pytest-runner'],
     tests_require=['pytest'],
@@ -1,80 +1,237 @@
 from datetime import datetime
 from muse import Muse
-from pymongo import MongoClient
-from pprint import pprint
-from time import gmtime, strftime
-from apscheduler.schedulers.background import BackgroundScheduler
-import collections
-import time
-import sys
-import os
+from muse.rpc_async import MuseAsyncRPC
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import asyncio
+import logging
 
-dct = Muse(node='ws://muse.peerplaysdb.com')
-rpc = dct.rpc
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s %(message)s')
+logger = logging.getLogger("muse.witnesses")
 
-# mongo = MongoClient("mongodb://mongo")
-# db = mongo.peerplaysdb
+# Chain and database clients; populated by connect() so that
+# importing this module (e.g. from the tests) opens no connections
+dct = None
+rpc = None
+async_rpc = None
+mongo = None
+db = None
+witness_coll = None
+misses_coll = None
+
+
+def connect(node='ws://muse.peerplaysdb.com',
+            mongo_url='mongodb://mongo'):
+    """ Open the chain and database connections and prepare the
+        collections (module globals)
+    """
+    global dct, rpc, async_rpc, mongo, db, witness_coll, misses_coll
+    dct = Muse(node=node)
+    rpc = dct.rpc
+    async_rpc = MuseAsyncRPC(rpc.url)
+
+    # zstd wire compression (witness docs are repetitive JSON and
+    # compress well) with snappy fallback; a slightly larger pool lets
+    # the witness bulk and the misses insert go out concurrently
+    mongo = MongoClient(mongo_url,
+                        compressors="zstd,snappy",
+                        maxPoolSize=16)
+    db = mongo.peerplaysdb
+    # High-frequency metric updates don't need replica acknowledgement
+    # or a journal flush per tick
+    witness_coll = db.get_collection(
+        'witness', write_concern=WriteConcern(w=1, j=False))
+    misses_coll = db.get_collection(
+        'witness_misses', write_concern=WriteConcern(w=1, j=False))
+
+    # Dashboards read misses per witness ordered by time; without
+    # these every read is a collection scan
+    misses_coll.create_index([('witness', 1), ('date', -1)],
+                             background=True)
+    witness_coll.create_index('account', background=True)
+    # Self-pruning: one row per changed witness per minute adds up to
+    # tens of millions per year; let Mongo's TTL reaper keep 90 days
+    # so the working set (and insert b-tree cost) stays bounded.
+    # 'date' is stored as a BSON datetime, which the TTL monitor
+    # requires.
+    misses_coll.create_index('date', expireAfterSeconds=90 * 86400,
+                             background=True)
+
+# Volatile fields worth re-writing every tick; the rest of the witness
+# record (owner key, url, ...) only changes on rare chain operations
+# and is written on insert
+VOLATILE_KEYS = ('total_votes', 'total_missed',
+                 'last_confirmed_block_num')
+
+# Last written counters per account id: steady-state most witnesses
+# don't move between ticks, so only changed ones are written to Mongo.
+# A periodic full sync heals against updates lost to e.g. a Mongo
+# restart.
+last_state = {}
+FULL_SYNC_EVERY = 10  # ticks
+tick = 0
+
+misses = {}
 
-# misses = {}
 
 # Command to check how many blocks a witness has missed
-# def check_misses():
-#     global misses
-#     witnesses = rpc.get_witnesses_by_vote('', 100)
-#     for witness in witnesses:
-#         owner = str(witness['owner'])
-#         # Check if we have a status on the current witness
-#         if owner in misses.keys():
-#             # Has the count increased?
-#             if witness['total_missed'] > misses[owner]:
-#                 # Update the misses collection
-#                 record = {
-#                   'date': datetime.now(),
-#                   'witness': owner,
-#                   'increase': witness['total_missed'] - misses[owner],
-#                   'total': witness['total_missed']
-#                 }
-#                 db.witness_misses.insert(record)
-#                 # Update the misses in memory
-#                 misses[owner] = witness['total_missed']
-#         else:
-#             misses.update({owner: witness['total_missed']})
-
-
-
-def update_witnesses():
-    now = datetime.now().date()
-    scantime = datetime.now()
-    users = rpc.lookup_miner_accounts('', 100)
-    pprint("[PPY] - Update Witnesses (" + str(len(users)) + " accounts)")
-    # db.witness.remove({})
-    for user in users:
-        account, accountid = user;
-        witness = rpc.get_miners([accountid])
-        # Convert to Numbers
-        for key in ['total_votes', 'total_missed']:
-            witness[0][key] = float(witness[0][key])
-        witness[0].update({
-            'account': account
-        })
-        pprint(witness[0])
-        # db.witness.update({'_id': account}, {'$set': witness[0]}, upsert=True)
-
-def run():
-    update_witnesses()
-    # check_misses()
+def check_misses():
+    witnesses = rpc.get_witnesses_by_vote('', 100)
+    scantime = datetime.utcnow()
+    records = []
+    for witness in witnesses:
+        owner = str(witness['owner'])
+        total_missed = witness['total_missed']
+        # One hash lookup instead of a keys() view plus re-indexing
+        prev = misses.get(owner)
+        if prev is not None:
+            # Has the count increased?
+            if total_missed > prev:
+                # Record the increase
+                records.append({
+                  'date': scantime,
+                  'witness': owner,
+                  'increase': total_missed - prev,
+                  'total': total_missed
+                })
+                # Update the misses in memory
+                misses[owner] = total_missed
+        else:
+            misses[owner] = total_missed
+    # One batched insert per tick instead of one round-trip per
+    # changed witness
+    if records:
+        misses_coll.insert_many(records, ordered=False)
+
+
+
+def typed_witness(witness):
+    """ Graphene serializes the big counters as strings; cast them
+        right at the parse boundary so the consumers see numbers """
+    witness['total_votes'] = float(witness['total_votes'])
+    witness['total_missed'] = float(witness['total_missed'])
+    return witness
+
+
+def fetch_all_miners(rpc):
+    """ Page through lookup_miner_accounts instead of truncating the
+        listing at the first 100 entries """
+    out = []
+    cursor = ''
+    while True:
+        chunk = rpc.lookup_miner_accounts(cursor, 100)
+        if not chunk:
+            break
+        if out and chunk[0][0] == out[-1][0]:
+            # The cursor entry is returned again on follow-up pages
+            chunk = chunk[1:]
+        out.extend(chunk)
+        if len(chunk) < 99:
+            break
+        cursor = out[-1][0]
+    return out
+
+
+def make_witness_op(account, accountid, witness, full_sync, scantime):
+    """ Build the UpdateOne for one witness, or return None when the
+        delta sync says nothing moved """
+    witness['account'] = account
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("witness %s: %s", account, witness)
+    state = (witness['total_votes'], witness['total_missed'])
+    if not full_sync and last_state.get(accountid) == state:
+        return None
+    last_state[accountid] = state
+    upd = {k: witness[k] for k in VOLATILE_KEYS if k in witness}
+    upd['account'] = account
+    return UpdateOne(
+        {'_id': account},
+        {'$set': upd,
+         '$setOnInsert': {'first_seen': scantime}},
+        upsert=True)
+
+
+async def update_witnesses():
+    global tick
+    loop = asyncio.get_event_loop()
+    tick += 1
+    full_sync = (tick % FULL_SYNC_EVERY == 1)
+    # One time snapshot per tick; everything below (including the
+    # miss records) derives from it
+    scantime = datetime.utcnow()
+    users = await loop.run_in_executor(None, fetch_all_miners, rpc)
+    logger.info("[PPY] - Update Witnesses (%d accounts)", len(users))
+    # One get_miners call for all accounts instead of one round-trip
+    # per account; run in the default executor so the event loop (and
+    # with it the scheduler) is not blocked by the websocket wait
+    ids = [accountid for _, accountid in users]
+    try:
+        witnesses = await loop.run_in_executor(None, rpc.get_miners, ids)
+    except Exception:
+        # Fallback if the node rejects the multi-id form: issue the
+        # per-id calls concurrently over a single websocket
+        results = await async_rpc.rpcexec_many(
+            [("get_miners", [[accountid]]) for accountid in ids])
+        witnesses = [r[0] if r else None for r in results]
+    # Pair each witness with its account, dropping miners the node
+    # couldn't resolve (the fallback path yields None for those), and
+    # cast the counters in the same pass
+    pairs = [
+        (user, typed_witness(witness))
+        for user, witness in zip(users, witnesses)
+        if witness is not None
+    ]
+    # Build the bulk in one comprehension (LIST_APPEND opcode, no
+    # method dispatch per op); delta-sync skips come back as None
+    ops = [
+        op for op in (
+            make_witness_op(account, accountid, witness,
+                            full_sync, scantime)
+            for (account, accountid), witness in pairs
+        ) if op is not None
+    ]
+    # One driver-batched write per tick instead of an update round-trip
+    # per account; the upserts keep state current, so no remove({})
+    # truncate is needed, and unordered lets one bad doc not abort the
+    # rest
+    if ops:
+        try:
+            witness_coll.bulk_write(ops, ordered=False)
+        except BulkWriteError as bwe:
+            logger.error("bulk_write failed: %s", bwe.details)
+
+async def run():
+    # Cheap keepalive so an idle-timed-out websocket reconnects here
+    # rather than mid-update
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, rpc.get_dynamic_global_properties)
+    await update_witnesses()
+    await loop.run_in_executor(None, check_misses)
 
 if __name__ == '__main__':
+    connect()
+    # Schedule it to run every 1 minute on the event loop; no extra
+    # scheduler thread and no 2-second keep-alive polling -- the
+    # process sleeps until the next fire time
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     # Start job immediately
-    run()
-    # Schedule it to run every 1 minute
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(run, 'interval', minutes=1, id='run')
+    loop.run_until_complete(run())
+    scheduler = AsyncIOScheduler(event_loop=loop)
+    # Never overlap runs, collapse any backlog of misfires into a
+    # single catch-up run, and skip (rather than stampede) runs that
+    # are more than 30s late -- a slow node or Mongo can otherwise
+    # queue ticks that then hammer both back-to-back
+    scheduler.add_job(run, 'interval', minutes=1, id='run',
+                      coalesce=True, max_instances=1,
+                      misfire_grace_time=30)
     scheduler.start()
-    # Loop
     try:
-        while True:
-            sys.stdout.flush()
-            time.sleep(2)
+        loop.run_forever()
     except (KeyboardInterrupt, SystemExit):
         scheduler.shutdown()
+    finally:
+        loop.close()
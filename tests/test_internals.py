@@ -0,0 +1,173 @@
+import importlib.util
+import json
+import os
+import time
+import unittest
+
+from muse.cache import TTLCache
+from muse.cli.ui import render_kv
+from museapi import exceptions
+from museapi.node import RPCBatch
+
+
+def _load_monitor():
+    """ Load the witness monitor script (test.py in the repository
+        root) without shadowing the stdlib ``test`` package
+    """
+    path = os.path.join(
+        os.path.dirname(__file__), os.pardir, "test.py")
+    spec = importlib.util.spec_from_file_location(
+        "witness_monitor", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeWebsocket():
+    """ Records sent frames and plays back a canned reply """
+    def __init__(self, reply):
+        self.reply = reply
+        self.sent = []
+
+    def send(self, frame):
+        self.sent.append(frame)
+
+    def recv(self):
+        return self.reply
+
+
+class FakeBatchRPC():
+    def __init__(self, reply):
+        self.ws = FakeWebsocket(reply)
+
+
+class FakeMinerRPC():
+    """ Mimics lookup_miner_accounts paging: entries are returned
+        sorted starting at the cursor (inclusive), ``limit`` at most
+    """
+    def __init__(self, miners):
+        self.miners = sorted(miners)
+        self.ncalls = 0
+
+    def lookup_miner_accounts(self, cursor, limit):
+        self.ncalls += 1
+        chunk = [m for m in self.miners if m[0] >= cursor]
+        return chunk[:limit]
+
+
+class Testcases(unittest.TestCase):
+
+    def test_ttlcache_get_set(self):
+        cache = TTLCache(maxsize=8, ttl=30)
+        cache["init0"] = {"id": "1.2.0"}
+        self.assertIn("init0", cache)
+        self.assertEqual(cache["init0"], {"id": "1.2.0"})
+        self.assertEqual(cache.get("missing", "default"), "default")
+
+    def test_ttlcache_expiry(self):
+        cache = TTLCache(maxsize=8, ttl=30)
+        cache["init0"] = "value"
+        # Age the entry past its deadline instead of sleeping
+        cache._store["init0"] = (time.time() - 1, "value")
+        self.assertNotIn("init0", cache)
+        self.assertIsNone(cache.get("init0"))
+
+    def test_ttlcache_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_ttlcache_pop(self):
+        cache = TTLCache(maxsize=8, ttl=30)
+        cache["init0"] = "value"
+        self.assertEqual(cache.pop("init0"), "value")
+        self.assertNotIn("init0", cache)
+        self.assertIsNone(cache.pop("init0"))
+        self.assertEqual(cache.pop("init0", "default"), "default")
+
+    def test_batch_accumulates(self):
+        batch = RPCBatch(FakeBatchRPC("[]"))
+        self.assertEqual(batch.get_block(1), 0)
+        self.assertEqual(batch.get_objects(["2.0.0"]), 1)
+        self.assertEqual(len(batch.calls), 2)
+        self.assertEqual(
+            batch.calls[0]["params"], [0, "get_block", [1]])
+        self.assertEqual(batch.calls[1]["id"], 1)
+
+    def test_batch_empty_execute(self):
+        rpc = FakeBatchRPC("[]")
+        batch = RPCBatch(rpc)
+        self.assertEqual(batch.execute(), [])
+        # Nothing accumulated, nothing sent
+        self.assertEqual(rpc.ws.sent, [])
+
+    def test_batch_execute_matches_by_id(self):
+        # Replies may come back in any order; results must follow the
+        # order the calls were added in
+        rpc = FakeBatchRPC(json.dumps([
+            {"id": 1, "result": ["2.0.0"]},
+            {"id": 0, "result": {"witness_account": "1.2.0"}},
+        ]))
+        batch = RPCBatch(rpc)
+        batch.get_witnesses(["1.6.1"])
+        batch.get_objects(["2.0.0"])
+        results = batch.execute()
+        self.assertEqual(results, [
+            {"witness_account": "1.2.0"},
+            ["2.0.0"],
+        ])
+        # One frame for the whole batch, and the batch is reusable
+        self.assertEqual(len(rpc.ws.sent), 1)
+        self.assertEqual(batch.calls, [])
+
+    def test_batch_execute_raises_on_error(self):
+        rpc = FakeBatchRPC(json.dumps([
+            {"id": 0, "error": {"message": "Assert Exception"}},
+        ]))
+        batch = RPCBatch(rpc)
+        batch.get_block(1)
+        with self.assertRaises(exceptions.RPCError):
+            batch.execute()
+
+    def test_render_kv(self):
+        lines = list(render_kv([
+            ("name", "init0"),
+            ("keys", "MUSE5abc\nMUSE5def"),
+        ]))
+        # Separator, header, separator, three value rows, separator
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(len(set(len(line) for line in lines)), 1)
+        self.assertEqual(lines[0], lines[2])
+        self.assertEqual(lines[0], lines[-1])
+        self.assertIn("Key", lines[1])
+        self.assertIn("Value", lines[1])
+        self.assertIn("init0", lines[3])
+        # Continuation lines repeat the value column only
+        self.assertIn("MUSE5def", lines[5])
+        self.assertNotIn("keys", lines[5])
+
+    def test_fetch_all_miners_single_page(self):
+        monitor = _load_monitor()
+        miners = [("miner%03d" % i, "1.6.%d" % i) for i in range(40)]
+        rpc = FakeMinerRPC(miners)
+        self.assertEqual(monitor.fetch_all_miners(rpc), miners)
+        self.assertEqual(rpc.ncalls, 1)
+
+    def test_fetch_all_miners_pagination(self):
+        monitor = _load_monitor()
+        miners = [("miner%03d" % i, "1.6.%d" % i) for i in range(150)]
+        rpc = FakeMinerRPC(miners)
+        out = monitor.fetch_all_miners(rpc)
+        # All entries, in order, without the cursor entry duplicated
+        # on the page boundary
+        self.assertEqual(out, miners)
+        self.assertEqual(rpc.ncalls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ from musebase.objects import Operation
 from musebase.signedtransactions import Signed_Transaction
 from musebase.account import PrivateKey
 import random
+import struct
 import unittest
 from pprint import pprint
 from binascii import hexlify
@@ -300,6 +301,47 @@ class Testcases(unittest.TestCase):
                    "df9788b909c7fafe232")
         self.assertEqual(compare[:-130], txWire[:-130])
 
+    def test_applyRequiredFees(self):
+        ops = [
+            Operation(operations.Transfer(**{
+                "fee": {"amount": 0, "asset_id": "1.3.0"},
+                "from": "1.2.0",
+                "to": "1.2.1",
+                "amount": {"amount": 1000000, "asset_id": "1.3.0"},
+                "prefix": prefix,
+            })),
+            Operation(operations.Transfer(**{
+                "fee": {"amount": 0, "asset_id": "1.3.0"},
+                "from": "1.2.1",
+                "to": "1.2.0",
+                "amount": {"amount": 50, "asset_id": "1.3.4"},
+                "prefix": prefix,
+            })),
+        ]
+        fees = [
+            {"amount": 2089843, "asset_id": "1.3.0"},
+            {"amount": 10, "asset_id": "1.3.4"},
+        ]
+        ops = transactions.applyRequiredFees(ops, fees)
+        for op, fee in zip(ops, fees):
+            opjson = op.json()[1]
+            self.assertEqual(opjson["fee"]["amount"], fee["amount"])
+            self.assertEqual(opjson["fee"]["asset_id"], fee["asset_id"])
+
+    def test_getBlockParamsFromProperties(self):
+        # head block number 99830 = 34294 | (1 << 16): the reference
+        # block number is only the low 16 bits
+        head_block_id = hexlify(
+            struct.pack(">I", 99830) +
+            struct.pack("<I", ref_block_prefix) +
+            bytes(12)).decode("ascii")
+        num, block_prefix = transactions.getBlockParamsFromProperties({
+            "head_block_number": 99830,
+            "head_block_id": head_block_id,
+        })
+        self.assertEqual(num, ref_block_num)
+        self.assertEqual(block_prefix, ref_block_prefix)
+
     def compareConstructedTX(self):
         # FIXME: Bet cancel does not serialize properly
         op = operations.Bet_cancel(**{